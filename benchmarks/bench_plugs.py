@@ -0,0 +1,74 @@
+"""
+Benchmark the cost of resolving a plug on a model. The string based lookup
+builds the full path of the node and parses it through a selection list,
+the direct lookup finds the plug using the dependency node and the cached
+attribute. Cache hits are measured separately.
+
+Usage:
+    mayapy benchmarks/bench_plugs.py [number_of_nodes]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+
+def run(number=10000):
+    """
+    :param int number:
+    """
+    from maya import cmds
+    from mango import fields
+    from mango.models import Model
+    from mango.utils import api
+    from mango.utils import path
+
+    class BenchModel(Model):
+        value = fields.IntegerField()
+
+    cmds.file(newFile=True, force=True)
+    models = [BenchModel(name="bench_{}".format(i)) for i in range(number)]
+
+    def measure(label, func):
+        for model in models:
+            model.delete_cache()
+
+        t = time.time()
+        for model in models:
+            func(model)
+
+        delta = time.time() - t
+        print("{:<12} {:>10.3f} us/lookup ({:.3f} s total)".format(
+            label,
+            delta / number * 1000000,
+            delta
+        ))
+
+    def lookup_string(model):
+        node = path.get(model.object, full_path=True)
+        return api.get_plug("{}.{}".format(node, "value"))
+
+    def lookup_direct(model):
+        return model.get_plug("value")
+
+    print("Plug lookups on {} nodes:".format(number))
+    measure("string", lookup_string)
+    measure("direct", lookup_direct)
+
+    t = time.time()
+    for model in models:
+        model.get_plug("value")
+
+    delta = time.time() - t
+    print("{:<12} {:>10.3f} us/lookup ({:.3f} s total)".format(
+        "cached",
+        delta / number * 1000000,
+        delta
+    ))
+
+
+if __name__ == "__main__":
+    from maya import standalone
+    standalone.initialize()
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
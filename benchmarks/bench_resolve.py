@@ -0,0 +1,85 @@
+"""
+Benchmark the cost of resolving registered models from nodes. Initializing
+a model using a function set creates the function set before the registry
+is consulted, which is the cost the relation managers paid for every
+connected node. Initializing using an object or resolving the object
+consults the registry first. The relation queries iterate the connections
+of a relation plug the same way the managers do, using both approaches.
+
+Usage:
+    mayapy benchmarks/bench_resolve.py [number_of_nodes]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+
+def run(number=10000):
+    """
+    :param int number:
+    """
+    from maya import cmds
+    from maya.api import OpenMaya
+    from mango import relations
+    from mango.models import Model
+
+    class BenchModel(Model):
+        link = relations.OneToManyRel(rev_name="link_rev")
+
+    cmds.file(newFile=True, force=True)
+    root = BenchModel(name="bench_root")
+    models = BenchModel.bulk_create([{"name": "bench_{}".format(i)} for i in range(number)])
+    root.link.add(*models)
+    objects = [model.object for model in models]
+
+    def measure(label, func):
+        t = time.time()
+        func()
+
+        delta = time.time() - t
+        print("{:<12} {:>10.3f} us/model ({:.3f} s total)".format(
+            label,
+            delta / number * 1000000,
+            delta
+        ))
+
+    def iter_connected(func):
+        plug = root.get_plug("link")
+        for index in plug.getExistingArrayAttributeIndices():
+            for plug_connected in plug.elementByLogicalIndex(index).connectedTo(False, True):
+                yield func(plug_connected.node())
+
+    def construct_dependency():
+        for m_object in objects:
+            BenchModel(OpenMaya.MFnDependencyNode(m_object))
+
+    def construct_object():
+        for m_object in objects:
+            BenchModel(m_object)
+
+    def resolve():
+        for m_object in objects:
+            BenchModel.resolve(m_object)
+
+    def query_dependency():
+        list(iter_connected(lambda m_object: BenchModel(OpenMaya.MFnDependencyNode(m_object))))
+
+    def query_resolve():
+        list(iter_connected(BenchModel.resolve))
+
+    print("Model resolution of {} nodes:".format(number))
+    measure("dependency", construct_dependency)
+    measure("object", construct_object)
+    measure("resolve", resolve)
+
+    print("Relation iteration of {} nodes:".format(number))
+    measure("dependency", query_dependency)
+    measure("resolve", query_resolve)
+
+
+if __name__ == "__main__":
+    from maya import standalone
+    standalone.initialize()
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
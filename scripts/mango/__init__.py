@@ -105,8 +105,11 @@ def refresh():
     but that is up to the user to organise.
     """
     # remove callbacks
+    from mango import scene
     from mango import models
-    for model in models.Model.objects.all():
+    scene.tracker.reset()
+    models.Model.registry.delete_callbacks()
+    for model in models.Model.registry:
         model.delete_callbacks()
 
     # delete modules
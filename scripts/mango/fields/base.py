@@ -1,6 +1,7 @@
 import abc
 from maya.api import OpenMaya
 
+from mango import indexes
 from mango.utils import api
 
 
@@ -15,12 +16,28 @@ class Field(object):
     in the models. The descriptors have the possibility to validate provided
     values. It is possible for fields to persist through subclasses if the
     persist flag is set.
+
+    Scalar fields that are indexable can be indexed by setting the index
+    flag. The values of indexed fields are tracked per model type, which
+    allows the default managers to filter on these fields without reading
+    the value of every model. Sorted indexes support range lookups as well.
+    Indexes are updated when the attribute is set or its connections change,
+    either through mango or outside of it, for example using cmds.setAttr
+    or the channel box. Models of which the attribute is driven by a
+    connection, for example by animation, are returned as candidates by
+    every lookup and are filtered by value.
+
+    The dtype is the NumPy data type used when reading the values of many
+    models into an array.
     """
     mfn = None
     mfn_type = None
     array = False
     compound = None
     default_value = None
+    dtype = "O"
+    indexable = False
+    index_sorted = False
 
     def __init__(
             self,
@@ -33,6 +50,7 @@ class Field(object):
             hidden=False,
             keyable=False,
             channel_box=False,
+            index=False,
     ):
         # set keyword arguments
         self.name = name
@@ -43,6 +61,10 @@ class Field(object):
         self.hidden = hidden
         self.keyable = keyable
         self.channel_box = channel_box
+        self.index = index
+
+        if index and (not self.indexable or self.array or self.compound):
+            raise TypeError("{} does not support indexes.".format(self.__class__.__name__))
 
         if choices and not isinstance(choices, (list, tuple, dict, set)):
             raise TypeError(
@@ -139,6 +161,28 @@ class Field(object):
         :param str/int/float/list/tuple/dict/None value:
         :param bool initialize:
         """
+        self.validate(value, initialize=initialize)
+
+        # create modifier
+        with api.MDGModifier() as modifier:
+            self.set_modifier(modifier, instance, value)
+
+        # update index
+        index = instance.get_index(self.name)
+        if index is not None:
+            index.update(instance)
+
+    def set_modifier(self, modifier, instance, value):
+        """
+        Add the operations to set the value of the instance to the provided
+        modifier. The value is not validated, this allows for the values of
+        many instances to be validated up front and set using a single
+        modifier. The index of the field is not updated.
+
+        :param OpenMaya.MDGModifier modifier:
+        :param models.Model instance:
+        :param str/int/float/list/tuple/dict/None value:
+        """
         def process_plug(plug_, value_):
             """
             Utility function to set a plug value. It is a function that will
@@ -172,18 +216,22 @@ class Field(object):
             else:
                 return self.set_plug_value(modifier, plug_, value_)
 
-        # run validators
-        start_index = int(not self.editable and initialize)
-        for validator in self.validators[start_index:]:
-            validator(value)
-
         # get plug
         plug = instance.get_plug(self.name)
         plug = self.get_parent_plug(plug)
+        process_plug(plug, value)
 
-        # create modifier
-        with api.MDGModifier() as modifier:
-            process_plug(plug, value)
+    def validate(self, value, initialize=False):
+        """
+        Run the validators of the field on the provided value. When
+        initializing the editable validator is skipped.
+
+        :param str/int/float/list/tuple/dict/None value:
+        :param bool initialize:
+        """
+        start_index = int(not self.editable and initialize)
+        for validator in self.validators[start_index:]:
+            validator(value)
 
     # ------------------------------------------------------------------------
 
@@ -272,6 +320,16 @@ class Field(object):
 
         return attribute
 
+    def create_index(self):
+        """
+        :return: Index
+        :rtype: indexes.Index/indexes.SortedIndex
+        """
+        if self.index_sorted:
+            return indexes.SortedIndex(self)
+
+        return indexes.Index(self)
+
     # ------------------------------------------------------------------------
 
     def add_attribute_to_instance(self, instance):
@@ -26,6 +26,9 @@ class IntegerField(base.Field, mixin.MinMaxValidatorMixin):
     mfn = OpenMaya.MFnNumericAttribute()
     mfn_type = OpenMaya.MFnNumericData.kLong
     default_value = 0
+    dtype = "i4"
+    indexable = True
+    index_sorted = True
 
     def __init__(self, min_value=None, max_value=None, **kwargs):
         super(IntegerField, self).__init__(**kwargs)
@@ -79,6 +82,9 @@ class FloatField(base.Field, mixin.MinMaxValidatorMixin):
     mfn = OpenMaya.MFnNumericAttribute()
     mfn_type = OpenMaya.MFnNumericData.kDouble
     default_value = 0.0
+    dtype = "f8"
+    indexable = True
+    index_sorted = True
 
     def __init__(self, min_value=None, max_value=None, **kwargs):
         super(FloatField, self).__init__(**kwargs)
@@ -132,6 +138,9 @@ class DegreeField(base.Field, mixin.MinMaxValidatorMixin):
     mfn = OpenMaya.MFnUnitAttribute()
     mfn_type = OpenMaya.MFnUnitAttribute.kAngle
     default_value = 0.0
+    dtype = "f8"
+    indexable = True
+    index_sorted = True
 
     def __init__(self, min_value=None, max_value=None, **kwargs):
         super(DegreeField, self).__init__(**kwargs)
@@ -209,6 +218,8 @@ class BooleanField(base.Field):
     mfn = OpenMaya.MFnNumericAttribute()
     mfn_type = OpenMaya.MFnNumericData.kBoolean
     default_value = True
+    dtype = "?"
+    indexable = True
 
     def __init__(self, **kwargs):
         super(BooleanField, self).__init__(**kwargs)
@@ -255,6 +266,7 @@ class StringField(base.Field):
     mfn = OpenMaya.MFnTypedAttribute()
     mfn_type = OpenMaya.MFnData.kString
     default_value = ""
+    indexable = True
 
     def __init__(self, **kwargs):
         super(StringField, self).__init__(**kwargs)
@@ -338,6 +350,7 @@ class EnumField(base.Field):
     """
     mfn = OpenMaya.MFnEnumAttribute()
     default_value = None
+    indexable = True
 
     def __init__(self, choices, **kwargs):
         if not isinstance(choices, dict):
@@ -0,0 +1,275 @@
+import bisect
+
+
+__all__ = [
+    "Index",
+    "SortedIndex",
+]
+
+
+class Index(object):
+    """
+    The index keeps track of the value of a field for every model of a
+    type. This allows for models to be retrieved by value without having to
+    read the value of every model. Models are stored by identity as the
+    registry guarantees there is only a single model per node.
+
+    The registry updates the index when an indexed attribute is set or its
+    connections change, an undo or redo marks the index as stale. A stale
+    index is rebuilt from the models of the type before it is used. Models
+    of which the attribute is driven by a connection can change value
+    without notice, these are not indexed by value but returned by every
+    lookup. The lookups therefore return candidates that still need to be
+    filtered.
+    """
+    def __init__(self, field):
+        self.field = field
+
+        self._values = {}
+        self._models = {}
+        self._driven = {}
+        self._stale = False
+
+    def __repr__(self):
+        return "<{}.{}: {}>".format(
+            self.__class__.__module__,
+            self.__class__.__name__,
+            self.field.name
+        )
+
+    def __len__(self):
+        """
+        :return: Number of indexed models
+        :rtype: int
+        """
+        return len(self._models) + len(self._driven)
+
+    # ------------------------------------------------------------------------
+
+    def add(self, model, value):
+        """
+        :param models.Model model:
+        :param value:
+        """
+        self.discard(model)
+        if value not in self._values:
+            self._add_value(value)
+
+        self._values[value][id(model)] = model
+        self._models[id(model)] = value
+
+    def discard(self, model):
+        """
+        :param models.Model model:
+        """
+        key = id(model)
+        self._driven.pop(key, None)
+        if key not in self._models:
+            return
+
+        value = self._models.pop(key)
+        models = self._values[value]
+        models.pop(key, None)
+        if not models:
+            self._remove_value(value)
+
+    def update(self, model):
+        """
+        Read the value of the field from the model and update the index.
+        When the attribute is driven by a connection the model is stored as
+        driven instead.
+
+        :param models.Model model:
+        """
+        if model.get_plug(self.field.name).isDestination:
+            self.discard(model)
+            self._driven[id(model)] = model
+        else:
+            self.add(model, self.field.get(model))
+
+    def clear(self):
+        self._values.clear()
+        self._models.clear()
+        self._driven.clear()
+
+    def is_stale(self):
+        """
+        :return: Stale state
+        :rtype: bool
+        """
+        return self._stale
+
+    def invalidate(self):
+        """
+        Mark the index as stale, the index will be rebuilt before it is used.
+        """
+        self._stale = True
+
+    def rebuild(self, models):
+        """
+        Clear the index and read the value of the field from all provided
+        models.
+
+        :param iterable models:
+        """
+        self.clear()
+        for model in models:
+            self.update(model)
+
+        self._stale = False
+
+    def _add_value(self, value):
+        """
+        :param value:
+        """
+        self._values[value] = {}
+
+    def _remove_value(self, value):
+        """
+        :param value:
+        """
+        del self._values[value]
+
+    # ------------------------------------------------------------------------
+
+    def lookup(self, lookup, value):
+        """
+        Get the models matching the lookup and the models of which the value
+        is driven, when the lookup is not supported by the index None is
+        returned.
+
+        :param str lookup:
+        :param value:
+        :return: Models matching the lookup
+        :rtype: list[models.Model]/None
+        """
+        models = self._lookup(lookup, value)
+        if models is None:
+            return None
+
+        return models + list(self._driven.values())
+
+    def _lookup(self, lookup, value):
+        """
+        :param str lookup:
+        :param value:
+        :return: Models matching the lookup
+        :rtype: list[models.Model]/None
+        """
+        if lookup in ("eq", "exact"):
+            return self.get(value)
+        elif lookup == "in":
+            return self.get_in(value)
+
+        return None
+
+    def get(self, value):
+        """
+        :param value:
+        :return: Models matching the value
+        :rtype: list[models.Model]
+        """
+        try:
+            return list(self._values.get(value, {}).values())
+        except TypeError:
+            return []
+
+    def get_in(self, values):
+        """
+        :param iterable values:
+        :return: Models matching any of the values
+        :rtype: list[models.Model]
+        """
+        models = []
+        for value in values:
+            models.extend(self.get(value))
+
+        return models
+
+
+class SortedIndex(Index):
+    """
+    The sorted index keeps the distinct values of the index sorted, this
+    allows for range lookups to be performed on the index.
+    """
+    def __init__(self, field):
+        super(SortedIndex, self).__init__(field)
+        self._keys = []
+
+    def clear(self):
+        super(SortedIndex, self).clear()
+        self._keys = []
+
+    def _add_value(self, value):
+        """
+        :param value:
+        """
+        super(SortedIndex, self)._add_value(value)
+        bisect.insort(self._keys, value)
+
+    def _remove_value(self, value):
+        """
+        :param value:
+        """
+        super(SortedIndex, self)._remove_value(value)
+        index = bisect.bisect_left(self._keys, value)
+        if index < len(self._keys) and self._keys[index] == value:
+            del self._keys[index]
+
+    # ------------------------------------------------------------------------
+
+    def _lookup(self, lookup, value):
+        """
+        On top of the lookups supported by the index the lookups lt, le, gt,
+        ge and range are supported. When the value cannot be compared to the
+        values in the index None is returned.
+
+        :param str lookup:
+        :param value:
+        :return: Models matching the lookup
+        :rtype: list[models.Model]/None
+        """
+        try:
+            if lookup == "lt":
+                return self.range(upper=value, include_upper=False)
+            elif lookup == "le":
+                return self.range(upper=value)
+            elif lookup == "gt":
+                return self.range(lower=value, include_lower=False)
+            elif lookup == "ge":
+                return self.range(lower=value)
+            elif lookup == "range":
+                return self.range(lower=value[0], upper=value[1])
+        except TypeError:
+            return None
+
+        return super(SortedIndex, self)._lookup(lookup, value)
+
+    def range(self, lower=None, upper=None, include_lower=True, include_upper=True):
+        """
+        :param lower:
+        :param upper:
+        :param bool include_lower:
+        :param bool include_upper:
+        :return: Models with a value within the range
+        :rtype: list[models.Model]
+        """
+        if lower is None:
+            start = 0
+        elif include_lower:
+            start = bisect.bisect_left(self._keys, lower)
+        else:
+            start = bisect.bisect_right(self._keys, lower)
+
+        if upper is None:
+            end = len(self._keys)
+        elif include_upper:
+            end = bisect.bisect_right(self._keys, upper)
+        else:
+            end = bisect.bisect_left(self._keys, upper)
+
+        models = []
+        for value in self._keys[start:end]:
+            models.extend(self._values[value].values())
+
+        return models
@@ -0,0 +1,232 @@
+import six
+import inspect
+import operator
+
+
+__all__ = [
+    "register_lookup",
+    "get_lookup",
+    "get_accessor",
+    "compile_filter",
+]
+
+
+LOOKUP_SEPARATOR = "__"
+LOOKUP_DEFAULT = "exact"
+CACHE_SIZE = 256
+
+_lookups = {}
+_accessors = {}
+_plans = {}
+
+
+def register_lookup(name, func=None):
+    """
+    Register a lookup that can be used in filters by appending it to a key
+    using a double underscore, for example 'name__startswith'. The lookup
+    function receives the value of the model and the value provided to the
+    filter and returns if the model matches. The function can be used as a
+    decorator when no function is provided.
+
+    :param str name:
+    :param callable/None func:
+    :return: Lookup function or decorator
+    :rtype: callable
+    """
+    def decorator(func_):
+        _lookups[name] = func_
+        return func_
+
+    if func is None:
+        return decorator
+
+    return decorator(func)
+
+
+def get_lookup(name):
+    """
+    Get the registered lookup of the provided name. For backwards
+    compatibility any name that is not registered is looked up in the
+    operator package.
+
+    :param str name:
+    :return: Lookup function
+    :rtype: callable
+    :raise RuntimeError: When the provided lookup cannot be found.
+    """
+    func = _lookups.get(name)
+    if func is None:
+        func = getattr(operator, name, None)
+
+    if func is None:
+        raise RuntimeError("Lookup '{}' cannot be found.".format(name))
+
+    return func
+
+
+# ----------------------------------------------------------------------------
+
+
+def _lower(value):
+    """
+    :param value:
+    :return: Lower case value
+    :rtype: str
+    """
+    return value.lower() if isinstance(value, six.string_types) else value
+
+
+register_lookup("exact", operator.eq)
+register_lookup("eq", operator.eq)
+register_lookup("ne", operator.ne)
+register_lookup("lt", operator.lt)
+register_lookup("le", operator.le)
+register_lookup("gt", operator.gt)
+register_lookup("ge", operator.ge)
+register_lookup("in", lambda a, b: a in b)
+register_lookup("contains", lambda a, b: b in a)
+register_lookup("range", lambda a, b: b[0] <= a <= b[1])
+register_lookup("isnull", lambda a, b: (a is None) is bool(b))
+register_lookup("iexact", lambda a, b: _lower(a) == _lower(b))
+register_lookup("icontains", lambda a, b: _lower(b) in _lower(a))
+register_lookup("startswith", lambda a, b: a.startswith(b))
+register_lookup("istartswith", lambda a, b: _lower(a).startswith(_lower(b)))
+register_lookup("endswith", lambda a, b: a.endswith(b))
+register_lookup("iendswith", lambda a, b: _lower(a).endswith(_lower(b)))
+
+
+# ----------------------------------------------------------------------------
+
+
+def _create_accessor(cls, key):
+    """
+    :param type cls:
+    :param str key:
+    :return: Accessor
+    :rtype: callable
+    """
+    # scalar and compound fields are read from the plugs directly, this
+    # prevents the recursion used to resolve arrays and compounds.
+    field = (getattr(cls, "fields", None) or {}).get(key)
+    if field is not None:
+        if field.array:
+            return field.get
+
+        name = field.name
+        get_plug_value = field.get_plug_value
+        if field.compound:
+            indices = range(len(field.compound))
+            return lambda obj: tuple(get_plug_value(obj.get_plug_child(name, i)) for i in indices)
+
+        return lambda obj: get_plug_value(obj.get_plug(name))
+
+    value = getattr(cls, key, None)
+    if isinstance(value, property):
+        return value.fget
+    elif inspect.isfunction(value) or inspect.ismethod(value):
+        return lambda obj: getattr(obj, key)()
+
+    return lambda obj: getattr(obj, key, None)
+
+
+def get_accessor(cls, key):
+    """
+    Get the function that retrieves the value of the provided key from an
+    instance of the class. Fields are read from their plugs, properties
+    are read using their getter and methods are called. The accessors are
+    cached per class and key.
+
+    :param type cls:
+    :param str key:
+    :return: Accessor
+    :rtype: callable
+    """
+    accessor = _accessors.get((cls, key))
+    if accessor is None:
+        if len(_accessors) >= CACHE_SIZE:
+            _accessors.clear()
+
+        accessor = _accessors[(cls, key)] = _create_accessor(cls, key)
+
+    return accessor
+
+
+# ----------------------------------------------------------------------------
+
+
+class Plan(object):
+    """
+    The plan is the parsed representation of a set of filter keys. Every
+    key is split into the attribute and lookup. The plan is independent of
+    the values that are filtered on which means it can be cached using the
+    keys and reused by filters that only differ in value.
+    """
+    def __init__(self, keys):
+        self.terms = []
+        for key in keys:
+            if key.find(LOOKUP_SEPARATOR) > 0:
+                attr, lookup = key.split(LOOKUP_SEPARATOR, 1)
+            else:
+                attr, lookup = key, LOOKUP_DEFAULT
+
+            self.terms.append((key, attr, get_lookup(lookup)))
+
+    def compile(self, kwargs):
+        """
+        :param dict kwargs:
+        :return: Filter function
+        :rtype: callable
+        """
+        terms = [(attr, func, kwargs[key]) for key, attr, func in self.terms]
+
+        def match(obj):
+            """
+            :param models.Model obj:
+            :return: Match state
+            :rtype: bool
+            """
+            cls = obj.__class__
+            for attr, func, value in terms:
+                try:
+                    if not func(get_accessor(cls, attr)(obj), value):
+                        return False
+                except (TypeError, ValueError, AttributeError):
+                    return False
+
+            return True
+
+        return match
+
+
+def get_plan(keys):
+    """
+    :param iterable keys:
+    :return: Cached plan of the keys
+    :rtype: Plan
+    :raise RuntimeError: When the provided lookup cannot be found.
+    """
+    signature = tuple(sorted(keys))
+    plan = _plans.get(signature)
+    if plan is None:
+        if len(_plans) >= CACHE_SIZE:
+            _plans.clear()
+
+        plan = _plans[signature] = Plan(signature)
+
+    return plan
+
+
+def compile_filter(**kwargs):
+    """
+    Convert the keyword arguments into a function that validates if an
+    object matches all of the keyword arguments. The filter supports keys
+    with double underscores like name__contains, index__lt etc. These are
+    split to retrieve the key and the lookup. If no lookup is found we
+    assume exact. The keys are parsed once and cached, evaluation stops as
+    soon as one of the keys doesn't match.
+
+    :return: Filter function
+    :rtype: callable
+    :raise RuntimeError: When the provided lookup cannot be found.
+    """
+    return get_plan(kwargs.keys()).compile(kwargs)
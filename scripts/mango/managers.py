@@ -1,16 +1,40 @@
 import six
 import abc
-import inspect
 import logging
-import operator
 from maya.api import OpenMaya
 
+from mango import query
+from mango import lookups
 from mango.utils import api
+from mango.utils import allocator
 
 
 log = logging.getLogger("mango")
 
 
+def create_attribute(name, rev=False, multi=False, hidden=False):
+    """
+    Create the message attribute of a relation. The attribute is a source
+    unless the relation is reversed, in which case it is a destination.
+
+    :param str name:
+    :param bool rev:
+    :param bool multi:
+    :param bool hidden:
+    :return: Attribute
+    :rtype: OpenMaya.MObject
+    """
+    attribute_type = OpenMaya.MFnMessageAttribute()
+    attribute = attribute_type.create(name, name)
+    attribute_type.connectable = True
+    attribute_type.array = multi
+    attribute_type.writable = rev
+    attribute_type.readable = not rev
+    attribute_type.indexMatters = False
+    attribute_type.hidden = hidden
+    return attribute
+
+
 @six.add_metaclass(abc.ABCMeta)
 class ManagerBase(object):
     """
@@ -38,13 +62,44 @@ class ManagerBase(object):
             self.__class__.__name__,
         )
 
+    def __iter__(self):
+        """
+        :return: Models
+        :rtype: generator[models.Model]
+        """
+        return self.all_iter()
+
     def __getitem__(self, item):
         """
-        :param int item:
-        :raise TypeError: When item is not an integer.
-        :raise Index: When item is out of range.
+        :param int/slice item:
+        :raise TypeError: When item is not an integer or slice.
+        :raise IndexError: When item is out of range.
+        """
+        return self.get_queryset()[item]
+
+    def __and__(self, other):
+        """
+        :param iterable other:
+        :return: Models that are part of both
+        :rtype: query.QuerySet
         """
-        return self.all()[item]
+        return self.get_queryset() & other
+
+    def __or__(self, other):
+        """
+        :param iterable other:
+        :return: Models that are part of either
+        :rtype: query.QuerySet
+        """
+        return self.get_queryset() | other
+
+    def __sub__(self, other):
+        """
+        :param iterable other:
+        :return: Models that are not part of the other
+        :rtype: query.QuerySet
+        """
+        return self.get_queryset() - other
 
     # ------------------------------------------------------------------------
 
@@ -80,6 +135,89 @@ class ManagerBase(object):
         """
         return next(self.filter_iter(**kwargs), None)
 
+    def bulk_update(self, models, **values):
+        """
+        Set the values of fields on many models using a single modifier,
+        which results in a single undo entry. A value is provided per model
+        using a dictionary with the models as keys or a NumPy array with a
+        row for every model. Lists and tuples contain a value per model for
+        scalar fields, for compound and array fields they are a single value.
+        Any other value is set on all models. All values are validated before
+        any of the values are set.
+
+        :param list[models.Model] models:
+        :return: Updated models
+        :rtype: list[models.Model]
+        :raise TypeError: When a key is not a field of the model.
+        :raise ValueError: When the number of values doesn't match the number of models.
+        """
+        models = list(models)
+        if not models or not values:
+            return models
+
+        # get values per model
+        columns = {}
+        for key, value in values.items():
+            field = models[0].fields.get(key)
+            per_model = field is None or not (field.array or field.compound)
+
+            if isinstance(value, dict):
+                missing = [model for model in models if model not in value]
+                if missing:
+                    raise ValueError(
+                        "Unable to update '{}', no value provided for {} model(s).".format(
+                            key,
+                            len(missing)
+                        )
+                    )
+
+                columns[key] = [value[model] for model in models]
+                continue
+            elif hasattr(value, "tolist"):
+                value = value.tolist()
+                per_model = True
+
+            if per_model and isinstance(value, (list, tuple)):
+                if len(value) != len(models):
+                    raise ValueError(
+                        "Unable to update '{}', {} values provided for {} models.".format(
+                            key,
+                            len(value),
+                            len(models)
+                        )
+                    )
+
+                columns[key] = value
+            else:
+                columns[key] = [value] * len(models)
+
+        # validate values
+        updates = []
+        for i, model in enumerate(models):
+            for validator in self._validators:
+                validator(model)
+
+            for key, column in columns.items():
+                field = model.fields.get(key)
+                if field is None:
+                    raise TypeError("'{}' object has no field '{}'.".format(model.__class__.__name__, key))
+
+                field.validate(column[i])
+                updates.append((model, field, column[i]))
+
+        # set values
+        with api.MDGModifier() as modifier:
+            for model, field, value in updates:
+                field.set_modifier(modifier, model, value)
+
+        # update indexes
+        for model, field, _ in updates:
+            index = model.get_index(field.name)
+            if index is not None:
+                index.update(model)
+
+        return models
+
     def get_or_create(self, **kwargs):
         """
         Return the an existing model matching the keyword arguments. If it
@@ -103,66 +241,60 @@ class ManagerBase(object):
         """
         :return: Filtered models
         :rtype: generator[models.Model]
-        :raise RuntimeError: When the provided operator cannot be found.
-        """
-        # convert kwargs into actual keys and the validation function. The
-        # filter supports keys with double underscores like name__contains,
-        # index__lt etc. These are split to retrieve the key and the
-        # function. If no function is found we assume eq.
-        mapper = []
-        for key, value in kwargs.items():
-            if key.find("__") > 0:
-                # get operator
-                key, func_name = key.split("__", 1)
-                func = getattr(operator, func_name)
-
-                # validate operator
-                if func is None:
-                    raise RuntimeError("Operator '{}' cannot be found "
-                                       "in the operator package.".format(func_name))
-
-                mapper.append((key, value, func))
-            else:
-                mapper.append((key, value, operator.eq))
-
-        # filter objects
+        :raise RuntimeError: When the provided lookup cannot be found.
+        """
+        match = lookups.compile_filter(**kwargs)
         for obj in self.all_iter():
-            matches = []
-
-            for key, match_value, func in mapper:
-                try:
-                    obj_value = getattr(obj, key, None)
-                    if inspect.isfunction(obj_value) or inspect.ismethod(obj_value):
-                        obj_value = obj_value()
-
-                    matches.append(func(obj_value, match_value))
-                except Exception as e:
-                    matches.append(False)
-                    log.debug(str(e))
-
-            if all(matches):
+            if match(obj):
                 yield obj
 
     def filter(self, **kwargs):
         """
-        The filter allows for operators to be attached to the keys. For
-        example 'name_contains' or 'index_ge' it'll require getting used to
-        the name of the rich operators. The operators package is used to do
-        these comparisons.
+        The filter allows for lookups to be attached to the keys. For
+        example 'name__contains' or 'index__ge'. The lookups are registered
+        in the lookups module, additional lookups can be registered using
+        lookups.register_lookup. The filter returns a lazy query set that can
+        be chained with other filters, excludes and orderings.
 
         Cheat sheet:
+            exact: a == b
+            iexact: a.lower() == b.lower()
             lt: a < b
             le: a <= b
             eq: a == b
             ne: a != b
             gt: a > b
             ge: a >= b
+            in: a in b
+            contains: b in a
+            icontains: b.lower() in a.lower()
+            startswith: a.startswith(b)
+            endswith: a.endswith(b)
+            range: b[0] <= a <= b[1]
+            isnull: (a is None) == b
+
+        Filters on indexed fields are resolved using the index.
 
         :return: Filtered models
-        :rtype: list[models.Model]
-        :raise RuntimeError: When the provided operator cannot be found.
+        :rtype: query.QuerySet
+        :raise RuntimeError: When the provided lookup cannot be found.
+        """
+        return self.get_queryset().filter(**kwargs)
+
+    def exclude(self, **kwargs):
+        """
+        :return: Models not matching the keyword arguments
+        :rtype: query.QuerySet
+        :raise RuntimeError: When the provided lookup cannot be found.
         """
-        return list(self.filter_iter(**kwargs))
+        return self.get_queryset().exclude(**kwargs)
+
+    def order_by(self, *keys):
+        """
+        :return: Ordered models
+        :rtype: query.QuerySet
+        """
+        return self.get_queryset().order_by(*keys)
 
     # ------------------------------------------------------------------------
 
@@ -177,19 +309,94 @@ class ManagerBase(object):
         """
         pass
 
+    def lookup_index(self, key, value):
+        """
+        Get the models matching the key and value using the indexes of the
+        models. When the key cannot be resolved using an index None is
+        returned and the models need to be filtered instead.
+
+        :param str key:
+        :param value:
+        :return: Models matching the key and value
+        :rtype: list[models.Model]/None
+        """
+        return None
+
+    def traverse(self, name, depth=None, direction="forward"):
+        """
+        Walk the relation of the provided name breadth first starting at all
+        models of the manager, see query.traverse.
+
+        :param str name:
+        :param int/None depth:
+        :param str direction: "forward" or "reverse"
+        :return: Models
+        :rtype: generator[models.Model]
+        :raise ValueError: When the direction is not forward or reverse.
+        :raise ValueError: When none of the models have the relation.
+        """
+        return query.traverse(self.all_iter(), name, depth=depth, direction=direction)
+
+    def prefetch_related(self, *lookups):
+        """
+        :param str lookups:
+        :return: Query set that prefetches the related models
+        :rtype: query.QuerySet
+        """
+        return self.get_queryset().prefetch_related(*lookups)
+
+    def get_queryset(self):
+        """
+        :return: Lazy query set of all models
+        :rtype: query.QuerySet
+        """
+        return query.QuerySet(self)
+
     def all(self):
         """
         :return: All models
-        :rtype: list[models.Model]
+        :rtype: query.QuerySet
         """
-        return list(self.all_iter())
+        return self.get_queryset()
+
+    def count(self):
+        """
+        :return: Number of models
+        :rtype: int
+        """
+        return sum(1 for _ in self.all_iter())
+
+    def exists(self):
+        """
+        :return: If the manager contains any models
+        :rtype: bool
+        """
+        return next(self.all_iter(), None) is not None
+
+    def values_list(self, *keys, **kwargs):
+        """
+        :param str keys:
+        :param bool flat:
+        :return: Values of all models
+        :rtype: list
+        """
+        return self.get_queryset().values_list(*keys, **kwargs)
+
+    def values_array(self, *keys):
+        """
+        :param str keys:
+        :return: Values of all models
+        :rtype: numpy.ndarray
+        :raise ImportError: When NumPy is not available.
+        """
+        return self.get_queryset().values_array(*keys)
 
     def length(self):
         """
         :return: Length
         :rtype: int
         """
-        return len(self.all())
+        return self.count()
 
     # ------------------------------------------------------------------------
 
@@ -232,19 +439,120 @@ class ManagerDefault(ManagerBase):
 
     # ------------------------------------------------------------------------
 
+    def bulk_create(self, kwargs_list):
+        """
+        Create an instance of the cls model for every dictionary of keyword
+        arguments. The nodes, attributes and values are created in batches
+        and result in a single undo entry.
+
+        :param list[dict] kwargs_list:
+        :return: Instances
+        :rtype: list[models.Model]
+        :raise TypeError: When unexpected keyword arguments are provided.
+        """
+        return self.cls.bulk_create(kwargs_list)
+
+    # ------------------------------------------------------------------------
+
+    def get_type_names(self):
+        """
+        :return: Names of the types managed
+        :rtype: list[str]
+        """
+        if self.typed:
+            return getattr(self.cls, "_types_future")[self.cls.__name__]
+
+        return [self.cls.__name__]
+
+    # ------------------------------------------------------------------------
+
     def all_iter(self):
         """
         :return: All models
         :rtype: generator[models.Model]
         """
-        if self.typed:
-            for name in getattr(self.cls, "_types_future")[self.cls.__name__]:
-                for obj in six.itervalues(getattr(self.cls, "_instances_typed")[name]):
-                    yield obj
-        else:
-            for obj in six.itervalues(getattr(self.cls, "_instances_typed")[self.cls.__name__]):
+        self.cls.hydrate(typed=self.typed)
+
+        registry = getattr(self.cls, "_registry")
+        for name in self.get_type_names():
+            for obj in registry.iter_type(name):
                 yield obj
 
+    def count(self):
+        """
+        The number of models is retrieved from the registry, which keeps
+        count of the models per type. When typed the counts of all types
+        that inherit from the class are added together.
+
+        :return: Number of models
+        :rtype: int
+        """
+        self.cls.hydrate(typed=self.typed)
+
+        registry = getattr(self.cls, "_registry")
+        return sum(registry.count_type(name) for name in self.get_type_names())
+
+    def exists(self):
+        """
+        :return: If the manager contains any models
+        :rtype: bool
+        """
+        self.cls.hydrate(typed=self.typed)
+
+        registry = getattr(self.cls, "_registry")
+        return any(registry.count_type(name) for name in self.get_type_names())
+
+    def reindex(self):
+        """
+        Mark the indexes of the managed types as stale, the indexes are
+        rebuilt when they are used. Changes to indexed attributes are
+        tracked by the registry, this can be used to force a rebuild.
+        """
+        types = getattr(self.cls, "_types")
+        for name in self.get_type_names():
+            if name in types:
+                for index in getattr(types[name], "_indexes").values():
+                    index.invalidate()
+
+    def lookup_index(self, key, value):
+        """
+        Get the models matching the key and value using the indexes of the
+        managed types. All types need to have the field indexed and the index
+        needs to support the lookup, if not None is returned. None is also
+        returned when the registry doesn't track the changes of indexed
+        attributes, as the indexes cannot be trusted to be fresh. The models
+        of which the value is driven by a connection are always included.
+
+        :param str key:
+        :param value:
+        :return: Models matching the key and value
+        :rtype: list[models.Model]/None
+        """
+        registry = getattr(self.cls, "_registry")
+        if not registry.has_index_callbacks():
+            return None
+
+        key, lookup = key.split("__", 1) if key.find("__") > 0 else (key, "eq")
+        self.cls.hydrate(typed=self.typed)
+
+        types = getattr(self.cls, "_types")
+        models = []
+        for name in self.get_type_names():
+            field = types[name].fields.get(key) if name in types else None
+            index = getattr(types[name], "_indexes").get(field.name) if field is not None else None
+            if index is None:
+                return None
+            elif index.is_stale():
+                index.rebuild(registry.iter_type(name))
+
+            matches = index.lookup(lookup, value)
+            if matches is None:
+                return None
+
+            models.extend(matches)
+
+        return [model for model in models if model.handle.isValid()]
+
 
 class Manager(ManagerBase):
     """
@@ -252,8 +560,12 @@ class Manager(ManagerBase):
     possible to add and more objects from the list and filter using keys
     and values. It is possible to manage only direct instances of a cls
     or using any of its subclasses.
+
+    The free indices of array plugs are handed out by an allocator, which
+    is seeded from the plug once per operation and reuses the holes left by
+    removed models.
     """
-    def __init__(self, instance, name, rev_name, rev=False, cls=None, typed=True, validators=()):
+    def __init__(self, instance, name, rev_name, rev=False, cls=None, typed=True, validators=(), cache=False):
         cls = cls if cls else instance.__class__
         super(Manager, self).__init__(cls, typed=typed, validators=validators)
 
@@ -261,6 +573,12 @@ class Manager(ManagerBase):
         self.name = name
         self.rev_name = rev_name
         self.rev = rev
+        self.cache = cache
+
+        self._cache = None
+
+        if cache:
+            getattr(self.cls, "_registry").register_connection_callbacks()
 
         if name == rev_name:
             raise RuntimeError(
@@ -301,36 +619,101 @@ class Manager(ManagerBase):
     def add(self, *models):
         """
         Loop over the provided models and add them to models list if they
-        pass the validator checks.
+        pass the validator checks. All connections are made using a single
+        modifier which results in a single undo entry. When the plug of the
+        manager is not an array only the last valid model is connected.
 
         :param models.Model models:
         :return: Added models
         :rtype: tuple[models.Model]
         """
-        def get_plug_element(plug_):
+        modifier = OpenMaya.MDGModifier()
+        models_valid = self.add_modifier(modifier, models)
+        if not models_valid:
+            return ()
+
+        api.execute_modifier(modifier)
+        self._cache = None
+        return models_valid
+
+    def add_modifier(self, modifier, models, allocators=None, pending=None):
+        """
+        Add the operations to connect the provided models to the modifier.
+        The models are validated but the connections are not made until the
+        modifier is executed, this allows for the models of many managers to
+        be connected using a single modifier.
+
+        The allocators and pending connections can be shared between calls
+        that use the same modifier. The allocators hand out the free indices
+        of the array plugs and are seeded once per plug. The pending
+        connections are the connections of plugs that are not an array that
+        are made by the modifier, these are disconnected together with the
+        existing connections when the plug is connected again.
+
+        :param OpenMaya.MDGModifier modifier:
+        :param tuple[models.Model] models:
+        :param dict/None allocators:
+        :param dict/None pending:
+        :return: Added models
+        :rtype: tuple[models.Model]
+        """
+        def get_plug_element(model_, name_, plug_):
             """
+            Get the plug to connect, for array plugs the next free element is
+            retrieved from the allocator of the plug. Holes left by removed
+            models are reused.
+
+            :param models.Model model_:
+            :param str name_:
             :param OpenMaya.MPlug plug_:
-            :return: Plug path
-            :rtype: str
+            :return: Plug
+            :rtype: OpenMaya.MPlug
             """
-            if plug_.isArray:
-                indices = plug_.getExistingArrayAttributeIndices()
-                indices.append(-1)
-                return plug_.elementByLogicalIndex(max(indices) + 1)
+            if not plug_.isArray:
+                return plug_
+
+            allocator_ = allocators.get((model_, name_))
+            if allocator_ is None:
+                allocator_ = allocators[(model_, name_)] = allocator.IndexAllocator()
+                allocator_.seed(plug_.getExistingArrayAttributeIndices())
 
-            return plug_
+            return plug_.elementByLogicalIndex(allocator_.allocate())
+
+        def get_plugs_connected(model_, name_, plug_, source_):
+            """
+            Get the plugs connected to a plug that is not an array. The
+            existing connections are only returned the first time, after
+            which only the connections pending in the modifier are returned.
+
+            :param models.Model model_:
+            :param str name_:
+            :param OpenMaya.MPlug plug_:
+            :param bool source_:
+            :return: Connected plugs
+            :rtype: list[OpenMaya.MPlug]
+            """
+            plugs_ = pending.get((model_, name_))
+            if plugs_ is not None:
+                return plugs_
+            elif source_:
+                return list(plug_.destinations()) if plug_.isDynamic else []
+
+            return [plug_.source()] if plug_.isDestination else []
 
         # validate nodes
         if not models:
-            return
+            return ()
 
-        # variables
-        models_added = []
-        models_connected = self.all()
+        allocators = {} if allocators is None else allocators
+        pending = {} if pending is None else pending
 
-        # add nodes
+        # variables, models are hashed using their handle which allows for
+        # the membership checks to be done in constant time.
+        models_valid = []
+        models_seen = set(self.all_iter())
+
+        # validate models
         for model in models:
-            # validate node
             if not model:
                 continue
             elif isinstance(model, six.string_types):
@@ -339,7 +722,7 @@ class Manager(ManagerBase):
             if model == self.instance:
                 log.warning("Node '{}' cannot be connected to itself.".format(self.instance.name))
                 continue
-            elif model in models_connected:
+            elif model in models_seen:
                 log.warning("Node '{}' is already connected.".format(model.name))
                 continue
 
@@ -347,40 +730,49 @@ class Manager(ManagerBase):
             for validator in self._validators:
                 validator(model)
 
-            # connections
+            models_seen.add(model)
+            models_valid.append(model)
+
+        plug = self.instance.get_plug(self.name)
+        if not plug.isArray:
+            models_valid = models_valid[-1:]
+
+        for model in models_valid:
+            # get plugs, the plugs are stored as source and target using the
+            # model and name of the plug as a key.
             connections = [None, None]
+            connections[int(self.rev)] = (self.instance, self.name, get_plug_element(self.instance, self.name, plug))
+            connections[int(not self.rev)] = (
+                model,
+                self.rev_name,
+                get_plug_element(model, self.rev_name, model.get_plug(self.rev_name))
+            )
+            (source_model, source_name, source_plug), (target_model, target_name, target_plug) = connections
+
+            # disconnect plugs, elements are always free so only plugs that
+            # are not an array can be connected.
+            if not source_plug.isElement:
+                for destination in get_plugs_connected(source_model, source_name, source_plug, True):
+                    if destination.isElement:
+                        modifier.removeMultiInstance(destination, True)
+                    else:
+                        modifier.disconnect(source_plug, destination)
 
-            # get plugs
-            plug = self.instance.get_plug(self.name)
-            plug = get_plug_element(plug)
-            connections[int(self.rev)] = plug
-
-            plug = model.get_plug(self.rev_name)
-            plug = get_plug_element(plug)
-            connections[int(not self.rev)] = plug
-
-            source_plug, target_plug = connections
-            with api.MDGModifier() as modifier:
-                # disconnect plugs
-                if source_plug.isConnected and source_plug.isDynamic:
-                    for destination in source_plug.destinations():
-                        if destination.isElement:
-                            modifier.removeMultiInstance(destination, True)
-                        else:
-                            modifier.disconnect(source_plug, destination)
-                if target_plug.isConnected:
-                    source = target_plug.source()
+                pending[(source_model, source_name)] = [target_plug]
+
+            if not target_plug.isElement:
+                for source in get_plugs_connected(target_model, target_name, target_plug, False):
                     if source.isElement:
                         modifier.removeMultiInstance(source, True)
                     else:
                         modifier.disconnect(source, target_plug)
 
-                # connect plugs
-                modifier.connect(*connections)
+                pending[(target_model, target_name)] = [source_plug]
 
-            models_added.append(model)
+            # connect plugs
+            modifier.connect(source_plug, target_plug)
 
-        return tuple(models_added)
+        return tuple(models_valid)
 
     def set(self, *models):
         """
@@ -409,9 +801,25 @@ class Manager(ManagerBase):
         if not remove_all and not models:
             return
 
-        # get plugs
+        def is_removed(m_object):
+            """
+            :param OpenMaya.MObject m_object:
+            :return: If the node should be removed
+            :rtype: bool
+            """
+            if remove_all:
+                return True
+
+            handle = OpenMaya.MObjectHandle(m_object)
+            return any(handle_ == handle for handle_ in handles.get(handle.hashCode(), ()))
+
+        # get plugs, the handles of the models are stored using their hash
+        # code which allows for the membership checks to be done in constant
+        # time.
         plug = self.instance.get_plug(self.name)
-        objects = [model.object for model in models]
+        handles = {}
+        for model in models:
+            handles.setdefault(model.hash_code, []).append(model.handle)
 
         with api.MDGModifier() as modifier:
             # delete connections
@@ -420,7 +828,7 @@ class Manager(ManagerBase):
                     plug_element = plug.elementByLogicalIndex(index)
                     plug_element_clear = False
                     for plug_connected in plug_element.connectedTo(self.rev, not self.rev):
-                        if remove_all or plug_connected.node() in objects:
+                        if is_removed(plug_connected.node()):
                             if plug.isElement:
                                 modifier.removeMultiInstance(plug_connected, True)
                             plug_element_clear = True
@@ -429,7 +837,7 @@ class Manager(ManagerBase):
                         modifier.removeMultiInstance(plug_element, True)
             else:
                 for plug_connected in plug.connectedTo(self.rev, not self.rev):
-                    if remove_all or plug_connected.node() in objects:
+                    if is_removed(plug_connected.node()):
                         if plug.isElement:
                             modifier.removeMultiInstance(plug_connected, True)
                         else:
@@ -438,29 +846,175 @@ class Manager(ManagerBase):
                             connections[int(not self.rev)] = plug_connected
                             modifier.disconnect(*connections)
 
+        self._cache = None
+
     def clear(self):
         """
         Remove all models from the manager.
         """
         self.remove(remove_all=True)
 
+    def invalidate(self):
+        """
+        Remove the cached models from the manager.
+        """
+        self._cache = None
+
+    def compact(self):
+        """
+        Renumber the elements of the manager's array plug so the connected
+        elements are stored at consecutive indices starting at zero, any
+        elements without connections are removed. All changes are made using
+        a single modifier. This keeps the file size and the cost of iterating
+        the elements down for sparse arrays.
+
+        :return: Number of renumbered or removed elements
+        :rtype: int
+        """
+        plug = self.instance.get_plug(self.name)
+        if not plug.isArray:
+            return 0
+
+        count = 0
+        with api.MDGModifier() as modifier:
+            # remove empty elements
+            elements = []
+            for index in sorted(plug.getExistingArrayAttributeIndices()):
+                plug_element = plug.elementByLogicalIndex(index)
+                plugs_connected = plug_element.connectedTo(self.rev, not self.rev)
+                if len(plugs_connected):
+                    elements.append((index, plug_element, plugs_connected))
+                else:
+                    modifier.removeMultiInstance(plug_element, True)
+                    count += 1
+
+            # renumber elements
+            for index_new, (index, plug_element, plugs_connected) in enumerate(elements):
+                if index == index_new:
+                    continue
+
+                modifier.removeMultiInstance(plug_element, True)
+                for plug_connected in plugs_connected:
+                    connections = [None, None]
+                    connections[int(self.rev)] = plug.elementByLogicalIndex(index_new)
+                    connections[int(not self.rev)] = plug_connected
+                    modifier.connect(*connections)
+
+                count += 1
+
+        self.invalidate()
+        return count
+
     # ------------------------------------------------------------------------
 
     def all_iter(self):
         """
+        When caching is enabled the connected models are resolved once and
+        stored until the connections of the plug change. When the models are
+        cached the cached models are returned, models of which the node no
+        longer exists are omitted.
+
         :return: Models
         :rtype: generator[models.Model]
         """
+        if self.get_cache() is None and self.cache:
+            self.set_cache(list(self.iter_connected()))
+
+        models = self.get_cache()
+        if models is not None:
+            for model in models:
+                if model.exists():
+                    yield model
+
+            return
+
+        for model in self.iter_connected():
+            yield model
+
+    def iter_connected(self):
+        """
+        :return: Models connected to the plug of the manager
+        :rtype: generator[models.Model]
+        """
         plug = self.instance.get_plug(self.name)
 
         if plug.isArray:
             for index in plug.getExistingArrayAttributeIndices():
                 plug_element = plug.elementByLogicalIndex(index)
                 for plug_connected in plug_element.connectedTo(self.rev, not self.rev):
-                    yield self.cls(plug_connected.node())
+                    yield self.cls.resolve(plug_connected.node())
         else:
             for plug_connected in plug.connectedTo(self.rev, not self.rev):
-                yield self.cls(plug_connected.node())
+                yield self.cls.resolve(plug_connected.node())
+
+    def prefetch(self):
+        """
+        Resolve the connected models and store them in the cache of the
+        manager. The cache is invalidated once the connections of the plug
+        change.
+
+        :return: Models
+        :rtype: list[models.Model]
+        """
+        getattr(self.cls, "_registry").register_connection_callbacks()
+        models = list(self.iter_connected())
+        self.set_cache(models)
+        return models
+
+    def get_single(self):
+        """
+        Get the connected model of a singular relation. The connection is
+        resolved directly from the plug and the model is retrieved from the
+        registry, only when the model is not registered it is constructed.
+        When caching is enabled the result is stored until the connections
+        of the plug change.
+
+        :return: Model
+        :rtype: models.Model/None
+        """
+        models = self.get_cache()
+        if models is not None:
+            model = models[0] if models else None
+            if model is None or model.exists():
+                return model
+
+        plug = self.instance.get_plug(self.name)
+        if plug.isArray:
+            return self.first()
+
+        model = None
+        for plug_connected in plug.connectedTo(self.rev, not self.rev):
+            model = self.cls.resolve(plug_connected.node())
+            break
+
+        if self.cache:
+            self.set_cache([model] if model is not None else [])
+
+        return model
+
+    def get_cache(self):
+        """
+        Get the cached models of the manager. The cache is only valid while
+        the registry tracks the connection changes, once the callbacks are
+        removed the cache is cleared.
+
+        :return: Cached models
+        :rtype: list[models.Model]/None
+        """
+        if self._cache is not None and not getattr(self.cls, "_registry").has_connection_callbacks():
+            self._cache = None
+
+        return self._cache
+
+    def set_cache(self, models):
+        """
+        Store the models in the cache of the manager, when the registry
+        doesn't track the connection changes nothing is stored.
+
+        :param list[models.Model] models:
+        """
+        if getattr(self.cls, "_registry").has_connection_callbacks():
+            self._cache = models
 
     # ------------------------------------------------------------------------
 
@@ -486,14 +1040,12 @@ class Manager(ManagerBase):
             return
 
         # create attribute
-        attribute_type = OpenMaya.MFnMessageAttribute()
-        attribute = attribute_type.create(name, name)
-        attribute_type.connectable = True
-        attribute_type.array = kwargs.get("multi", False)
-        attribute_type.writable = rev
-        attribute_type.readable = not rev
-        attribute_type.indexMatters = False
-        attribute_type.hidden = kwargs.get("hidden", False)
+        attribute = create_attribute(
+            name,
+            rev=rev,
+            multi=kwargs.get("multi", False),
+            hidden=kwargs.get("hidden", False),
+        )
 
         # add attribute
         instance.add_attribute(attribute)
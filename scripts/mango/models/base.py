@@ -1,17 +1,21 @@
 import six
+import hashlib
 import logging
 import importlib
 from functools import wraps
+from collections import namedtuple
 from maya import cmds
 from maya.api import OpenMaya
 
+from mango import query
 from mango import fields
 from mango import managers
+from mango import registry
 from mango import relations
 from mango.utils import api
 from mango.utils import path
 from mango.utils import naming
-from mango.utils import decorator
+from mango.utils import timing
 
 
 __all__ = [
@@ -20,8 +24,11 @@ __all__ = [
 
 
 RESERVED = {"name", "parent"}
+SCHEMA = "mango_schema"
 log = logging.getLogger("mango")
 
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "attributes", "plugs"])
+
 
 def validate_model(func):
     """
@@ -47,6 +54,21 @@ def validate_model(func):
     return wrapper
 
 
+def create_tag_attribute(name):
+    """
+    Create a hidden string attribute used to tag the node with its type or
+    schema.
+
+    :param str name:
+    :return: Attribute
+    :rtype: OpenMaya.MObject
+    """
+    attribute_type = OpenMaya.MFnTypedAttribute()
+    attribute = attribute_type.create(name, name, OpenMaya.MFnData.kString)
+    attribute_type.hidden = True
+    return attribute
+
+
 def import_model(type_module, type_name):
     """
     :param str type_module:
@@ -76,25 +98,31 @@ class ModelMeta(type):
     by the managers and instance are returned using the correct type. It also
     handles the different constructors that can be used to initialize a model.
 
-    Any instances are being tracked to ensure the type managers are able to
-    return all the objects belonging to a certain type including its inherited
-    history.
+    Any instances are being tracked in the registry to ensure the type
+    managers are able to return all the objects belonging to a certain type
+    including its inherited history.
 
     The path to the type classes are stored on the nodes and will be used to
     import the specific type. An ImportError will be raised when the type
     cannot be imported. If the model itself is used it will not tag the type
     onto the node, this opens up the model to be used to connect but not
     pollute the random node with a specific type.
+
+    Next to the type a schema fingerprint is stored on the nodes. This
+    fingerprint is a hash of the field and relation definitions of the type.
+    When both the type and the schema of a node match, the node is trusted
+    to have all of its attributes and the attribute validation is skipped.
     """
     fields = None  # type: dict
     relations = None  # type: dict
     node_type = None  # type: str
     _default_manager = None  # type: managers.ManagerDefault
     _default_manager_typed = None  # type: managers.ManagerDefault
+    _schema = None  # type: str
+    _indexes = None  # type: dict
     _types = {}
     _types_future = {}
-    _instances = {}
-    _instances_typed = {}
+    _registry = registry.Registry()
 
     def __new__(mcs, name, bases, attrs):
         def get_persisting_objects(obj_key):
@@ -150,6 +178,14 @@ class ModelMeta(type):
         new_type = super(ModelMeta, mcs).__new__(mcs, name, bases, attrs)
         new_type._default_manager = managers.ManagerDefault(new_type, typed=False)
         new_type._default_manager_typed = managers.ManagerDefault(new_type, typed=True)
+        new_type._schema = None
+        new_type._indexes = {
+            field.name: field.create_index()
+            for field in new_type.fields.values()
+            if field.index
+        }
+        for index in new_type._indexes.values():
+            mcs._registry.register_index(index)
 
         # cache new type and its future
         mcs._types[name] = new_type
@@ -159,8 +195,6 @@ class ModelMeta(type):
             if mcs._types.get(mro.__name__):
                 mcs._types_future[mro.__name__].append(name)
 
-        mcs._instances_typed[name] = {}
-
         # set reverse relationships
         for relation in list(attrs["relations"].values()):
             # skip reverse relations
@@ -204,6 +238,7 @@ class ModelMeta(type):
                         hidden=relation.rev_hidden,
                         persist=relation.persist,
                         typed=relation.typed,
+                        cache=relation.cache,
                     )
 
                 rev_relation.rev = True
@@ -212,6 +247,7 @@ class ModelMeta(type):
                 # add reverse type
                 reverse_type_relations[relation.rev_name] = rev_relation
                 setattr(reverse_type, relation.rev_name, rev_relation)
+                reverse_type._schema = None
 
         return new_type
 
@@ -260,6 +296,26 @@ class ModelMeta(type):
 
             return obj, OpenMaya.MFnDependencyNode(obj)
 
+        def tag_node(name, value):
+            """
+            Store the value in the tag attribute of the node, the attribute
+            is created if it doesn't exist yet.
+
+            :param str name:
+            :param str value:
+            """
+            if not mfn_dependency.hasAttribute(name):
+                mfn_dependency.addAttribute(create_tag_attribute(name))
+
+            mfn_dependency.findPlug(name, False).setString(value)
+
+        # get cache, when initializing using an object the registry is
+        # consulted before the function set of the node is created.
+        if args and isinstance(args[0], OpenMaya.MObject):
+            node = cls._registry.get(OpenMaya.MObjectHandle(args[0]))
+            if node is not None:
+                return node
+
         # initialize or create node
         if args:
             m_object, mfn_dependency = initialize_node()
@@ -268,46 +324,282 @@ class ModelMeta(type):
             m_object = create_node()
             mfn_dependency = OpenMaya.MFnDependencyNode(m_object)
 
-        # get hex
-        handle = OpenMaya.MObjectHandle(m_object)
-        hx = "{:02x}".format(handle.hashCode())
-
         # get cache
-        if handle.isValid():
-            try:
-                node = cls._instances[hx]
-                assert node.exists()
-            except (KeyError, AssertionError):
-                cls._instances.pop(hx, None)
+        handle = OpenMaya.MObjectHandle(m_object)
+        node = cls._registry.get(handle)
+        if node is not None:
+            return node
+
+        # get type, when the stored type matches the type that is found the
+        # node was created using this type and its attributes are trusted to
+        # exist. Migration is responsible for adding missing attributes.
+        hydrate = False
+        with timing.phase("type import"):
+            has_type = mfn_dependency.hasAttribute("mango")
+            if has_type:
+                type_value = mfn_dependency.findPlug("mango", False).asString()
+                type_module, type_name = type_value.rsplit(".", 1)
+                sup = cls._types.get(type_name) or import_model(type_module, type_name)
+                hydrate = (
+                    not kwargs
+                    and type_value == "{}.{}".format(sup.__module__, sup.__name__)
+                    and mfn_dependency.hasAttribute(SCHEMA)
+                    and mfn_dependency.findPlug(SCHEMA, False).asString() == sup.schema
+                )
+            elif cls != Model:
+                tag_node("mango", "{}.{}".format(cls.__module__, cls.__name__))
+                sup = cls
             else:
-                return node
+                sup = cls
 
-        # get type
-        has_type = mfn_dependency.hasAttribute("mango")
-        if has_type:
-            type_value = mfn_dependency.findPlug("mango", False).asString()
-            type_module, type_name = type_value.rsplit(".", 1)
-            sup = cls._types.get(type_name, import_model(type_module, type_name))
-        elif cls != Model:
-            attribute_type = OpenMaya.MFnTypedAttribute()
-            attribute = attribute_type.create("mango", "mango", OpenMaya.MFnData.kString)
-            attribute_type.hidden = True
-            mfn_dependency.addAttribute(attribute)
+        # initialize model
+        instance = super(ModelMeta, sup).__call__(handle, m_object, mfn_dependency, hydrate, **kwargs)
 
-            plug = mfn_dependency.findPlug("mango", False)
-            plug.setString("{}.{}".format(cls.__module__, cls.__name__))
+        # tag schema, the schema is only stored once the fields and relations
+        # are created. A node of which the initialization failed is missing
+        # the schema, which makes sure its attributes are validated the next
+        # time it is initialized.
+        if not has_type and cls != Model:
+            tag_node(SCHEMA, cls.schema)
 
-            sup = cls
-        else:
-            sup = cls
+        with timing.phase("callback registration"):
+            cls._registry.add(instance)
 
-        # initialize model
-        instance = super(ModelMeta, sup).__call__(hx, m_object, mfn_dependency, **kwargs)
-        cls._instances[hx] = instance
-        cls._instances_typed[instance.type][hx] = instance
+        if instance._indexes:
+            with timing.phase("index update"):
+                instance.update_indexes()
 
         return instance
 
+    def bulk_create(cls, kwargs_list):
+        """
+        Create many models at once. The keyword arguments and field values
+        are validated before any nodes are created. The nodes are created
+        using a single modifier, after which the attributes and values of
+        all nodes are added using batched modifiers. As the nodes are tagged
+        with the current schema the models are constructed without
+        validating their attributes. Everything is wrapped in a single undo
+        entry.
+
+        The connections of the relations of all models are made using a
+        single modifier. Relation values are validated when the connections
+        are added to the modifier. When this fails all changes are undone
+        and the models are removed from the registry before the error is
+        raised. Namespaces that were created for the names of the nodes are
+        kept.
+
+        :param list[dict] kwargs_list:
+        :return: Models
+        :rtype: list[Model]
+        :raise TypeError: When unexpected keyword arguments are provided.
+        """
+        if not kwargs_list:
+            return []
+
+        # validate keyword arguments
+        keys = set(cls.fields.keys()) | set(cls.relations.keys()) | RESERVED
+        for kwargs in kwargs_list:
+            keys_unexpected = set(kwargs.keys()) - keys
+            if keys_unexpected:
+                raise TypeError(
+                    "{}.__init__() got unexpected keyword argument(s) '{}'.".format(
+                        cls.__name__,
+                        "', '".join(keys_unexpected)
+                    )
+                )
+
+            for key, field in cls.fields.items():
+                if key in kwargs:
+                    field.validate(kwargs[key], initialize=True)
+
+        # get names and parents
+        names = []
+        parents = []
+        for kwargs in kwargs_list:
+            parent = kwargs.get("parent")
+            if isinstance(parent, Model):
+                parent = parent.object
+
+            names.append(kwargs.get("name", "{}#".format(cls.node_type)))
+            parents.append(parent)
+
+        with api.UndoChunk():
+            # create nodes
+            with timing.phase("node creation"):
+                m_objects = api.create_nodes(cls.node_type, names, parents)
+
+            # add attributes, the type and schema tag are only added when not
+            # creating the base model. As all nodes are of the same type any
+            # existing attributes are only checked on the first node.
+            tags = ()
+            if cls is not Model:
+                tags = (("mango", "{}.{}".format(cls.__module__, cls.__name__)), (SCHEMA, cls.schema))
+
+            mfn_dependency = OpenMaya.MFnDependencyNode(m_objects[0])
+            attributes = [
+                obj for obj in list(cls.fields.values()) + list(cls.relations.values())
+                if not mfn_dependency.hasAttribute(obj.name)
+            ]
+
+            with timing.phase("attribute creation"):
+                with api.MDGModifier() as modifier:
+                    for m_object in m_objects:
+                        for name, _ in tags:
+                            modifier.addAttribute(m_object, create_tag_attribute(name))
+                        for obj in attributes:
+                            modifier.addAttribute(m_object, obj.create())
+
+                with api.MDGModifier() as modifier:
+                    for m_object in m_objects:
+                        mfn_dependency = OpenMaya.MFnDependencyNode(m_object)
+                        for name, value in tags:
+                            modifier.newPlugValueString(mfn_dependency.findPlug(name, False), value)
+
+            # initialize models
+            models = [cls(m_object) for m_object in m_objects]
+
+            # set values
+            with timing.phase("attribute assignment"):
+                with api.MDGModifier() as modifier:
+                    for model, kwargs in zip(models, kwargs_list):
+                        for key, field in cls.fields.items():
+                            if key in kwargs:
+                                field.set_modifier(modifier, model, kwargs[key])
+
+            for model in models:
+                if model._indexes:
+                    model.update_indexes()
+
+            # set relations, the connections of all models are made using a
+            # single modifier. The allocators and pending connections are
+            # shared so the free indices of every plug are only seeded once.
+            # When a relation fails the models are removed from the registry
+            # and the undo chunk undoes all changes.
+            try:
+                with timing.phase("relation assignment"):
+                    modifier = OpenMaya.MDGModifier()
+                    allocators = {}
+                    pending = {}
+                    managers_ = []
+                    for model, kwargs in zip(models, kwargs_list):
+                        for key, relation in cls.relations.items():
+                            if key in kwargs:
+                                values = kwargs[key]
+                                values = values if isinstance(values, (list, tuple, set)) else [values]
+                                manager = relation.get_manager_from_instance(model)
+                                manager.add_modifier(modifier, values, allocators, pending)
+                                managers_.append(manager)
+
+                    if managers_:
+                        api.execute_modifier(modifier)
+                        for manager in managers_:
+                            manager.invalidate()
+            except Exception:
+                for model in models:
+                    model._emit_deleted()
+
+                raise
+
+        return models
+
+    # ------------------------------------------------------------------------
+
+    @property
+    def schema(cls):
+        """
+        The schema is a fingerprint of the field and relation definitions of
+        the type. It is computed when first requested and reset when reverse
+        relations are added to the type.
+
+        :return: Schema
+        :rtype: str
+        """
+        if cls._schema is None:
+            definitions = []
+            for name, field in sorted(cls.fields.items()):
+                definitions.append("field:{}:{}:{}:{}".format(
+                    field.name,
+                    field.__class__.__name__,
+                    field.array,
+                    field.compound,
+                ))
+
+            for name, relation in sorted(cls.relations.items()):
+                definitions.append("relation:{}:{}:{}".format(
+                    relation.name,
+                    relation.multi,
+                    relation.rev,
+                ))
+
+            definitions = "\n".join(definitions).encode("utf-8")
+            cls._schema = hashlib.md5(definitions).hexdigest()
+
+        return cls._schema
+
+    # ------------------------------------------------------------------------
+
+    def hydrate(cls, typed=True):
+        """
+        Initialize the pending nodes in the registry that belong to this
+        type. When typed the pending nodes of any types that inherit from
+        this type are initialized as well. Types of pending nodes are
+        imported first to make sure the inheritance of all types is known.
+        Nodes that fail to initialize will present a warning to the user.
+
+        :param bool typed:
+        """
+        if not cls._registry.has_pending():
+            return
+
+        # import types
+        for type_value in cls._registry.pending_types():
+            type_module, type_name = type_value.rsplit(".", 1)
+            if type_name in cls._types:
+                continue
+
+            try:
+                import_model(type_module, type_name)
+            except ImportError as e:
+                handles = cls._registry.pop_pending(type_value)
+                log.warning("Unable to initialize {} node(s) of type '{}'; {}".format(
+                    len(handles),
+                    type_value,
+                    str(e)
+                ))
+
+        # initialize nodes
+        names = set(cls._types_future[cls.__name__]) if typed else {cls.__name__}
+        for type_value in cls._registry.pending_types():
+            if type_value.rsplit(".", 1)[-1] not in names:
+                continue
+
+            for handle in cls._registry.pop_pending(type_value):
+                try:
+                    cls(handle.object())
+                except (RuntimeError, ImportError) as e:
+                    log.warning("Unable to initialize node '{}'; {}".format(
+                        OpenMaya.MFnDependencyNode(handle.object()).name(),
+                        str(e)
+                    ))
+
+    def resolve(cls, m_object):
+        """
+        Resolve the model of the provided object. The registry is consulted
+        first, only when the node is not registered the model is constructed.
+        This is the same path the constructor takes when it is provided an
+        object, resolving a registered node saves the creation of the
+        function set of the node and the parsing of the arguments.
+
+        :param OpenMaya.MObject m_object:
+        :return: Model
+        :rtype: Model
+        """
+        model = cls._registry.get(OpenMaya.MObjectHandle(m_object))
+        if model is None:
+            model = cls(m_object)
+
+        return model
+
     # ------------------------------------------------------------------------
 
     @property
@@ -326,6 +618,14 @@ class ModelMeta(type):
         """
         return self._default_manager_typed
 
+    @property
+    def registry(self):
+        """
+        :return: Registry
+        :rtype: registry.Registry
+        """
+        return self._registry
+
 
 @six.add_metaclass(ModelMeta)
 class Model(object):
@@ -348,31 +648,47 @@ class Model(object):
     When creating a new model the keyword arguments 'name' and 'parent' are
     always present and can be used. Any other arguments are dependant on the
     fields and relations added to the model class.
+
+    The deletion of nodes is tracked by a single callback owned by the
+    registry. If a model requires callbacks for every instance the
+    node_callbacks attribute can be set to True, the create_callbacks
+    function can be extended to register any additional callbacks.
     """
     fields = None  # type: dict
     relations = None  # type: dict
     node_type = "network"
+    node_callbacks = False
 
     def __init__(self, *args, **kwargs):
         # variables
         self._exists = True
         self._callbacks = []
-        self._hx, self._m_object, self._mfn_dependency = args
-
-        # add relations
-        for key, relation in self.relations.items():
-            manager = relation.add_manager_to_instance(self)
-            if key in kwargs:
-                values = kwargs.pop(key) if key in kwargs else None
-                values = values if isinstance(values, (list, tuple, set)) else [values]
-                manager.set(*values)
+        self._managers = {}
+        self._cache_attributes = {}
+        self._cache_plugs = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._handle, self._m_object, self._mfn_dependency, hydrate = args
+        self._hash_code = self._handle.hashCode()
+
+        # add relations, when hydrating an existing node the attributes are
+        # trusted to exist and only the managers are created.
+        with timing.phase("manager creation"):
+            for key, relation in self.relations.items():
+                manager = relation.add_manager_to_instance(self, hydrate=hydrate)
+                if key in kwargs:
+                    values = kwargs.pop(key) if key in kwargs else None
+                    values = values if isinstance(values, (list, tuple, set)) else [values]
+                    manager.set(*values)
 
         # add fields
-        for key, field in self.fields.items():
-            field.add_attribute_to_instance(self)
-            if key in kwargs:
-                value = kwargs.pop(key)
-                field.set(self, value, initialize=True)
+        if not hydrate:
+            with timing.phase("attribute validation"):
+                for key, field in self.fields.items():
+                    field.add_attribute_to_instance(self)
+                    if key in kwargs:
+                        value = kwargs.pop(key)
+                        field.set(self, value, initialize=True)
 
         # error when there are left over keyword arguments, when errors are
         # present the node is deleted.
@@ -385,30 +701,25 @@ class Model(object):
                 )
             )
 
-        # create callbacks
-        self.create_callback(
-            OpenMaya.MNodeMessage.addNodeDestroyedCallback,
-            self.object,
-            self._emit_deleted,
-            None
-        )
-
-        self.create_callback(
-            OpenMaya.MNodeMessage.addNodeAboutToDeleteCallback,
-            self.object,
-            self._emit_deleted,
-            None
-        )
+        # create callbacks, the deletion of nodes is handled by the registry
+        # for all models. Models that require their own hooks can opt-in to
+        # register callbacks for every instance.
+        if self.node_callbacks:
+            with timing.phase("callback registration"):
+                self.create_callbacks()
 
     # ------------------------------------------------------------------------
 
     def __eq__(self, other):
         """
+        Models are compared using their handles, this allows for models of
+        which the node is deleted to be compared as well.
+
         :param Base other:
         :return: Equal state
         :rtype: bool
         """
-        return isinstance(other, Model) and self.object == other.object
+        return isinstance(other, Model) and (self is other or self._handle == other._handle)
 
     def __ne__(self, other):
         """
@@ -416,7 +727,18 @@ class Model(object):
         :return: Not equal state
         :rtype: bool
         """
-        return isinstance(other, Model) and self.object != other.object
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        """
+        The hash is the hash code of the node handle, which is stored when
+        the model is initialized and remains the same after the node is
+        deleted.
+
+        :return: Hash
+        :rtype: int
+        """
+        return self._hash_code
 
     def __repr__(self):
         """
@@ -437,25 +759,65 @@ class Model(object):
         representation of the nodes state in the scene. This also removed any
         callbacks attached to the node.
         """
-        # remove callbacks and caches on instance
+        # remove callbacks, caches and indexes on instance
         self._exists = False
         self.delete_cache()
         self.delete_callbacks()
+        self.discard_indexes()
+
+        # remove instance from registry
+        getattr(self.__class__, "_registry").remove(self)
+
+    def _emit_connection_changed(self, plug):
+        """
+        Invalidate the cache of the manager that belongs to the plug of
+        which the connections changed. This function is called by the
+        registry.
 
-        # remove caches on class
-        cls = self.__class__
-        getattr(cls, "_instances").pop(self.hx, None)
-        getattr(cls, "_instances_typed")[cls.__name__].pop(self.hx, None)
+        :param OpenMaya.MPlug plug:
+        """
+        name = OpenMaya.MFnAttribute(plug.attribute()).name
+        manager = self._managers.get(name)
+        if manager is not None:
+            manager.invalidate()
+
+    def _emit_attribute_changed(self, plug):
+        """
+        Update the index that belongs to the plug of which the value or the
+        connections changed. This function is called by the registry.
+
+        :param OpenMaya.MPlug plug:
+        """
+        name = OpenMaya.MFnAttribute(plug.attribute()).name
+        index = self.get_index(name)
+        if index is not None:
+            index.update(self)
 
     # ------------------------------------------------------------------------
 
+    @property
+    def handle(self):
+        """
+        :return: Handle
+        :rtype: OpenMaya.MObjectHandle
+        """
+        return self._handle
+
+    @property
+    def hash_code(self):
+        """
+        :return: Hash code of the handle
+        :rtype: int
+        """
+        return self._hash_code
+
     @property
     def hx(self):
         """
         :return: Hex
         :rtype: str
         """
-        return self._hx
+        return "{:02x}".format(self._hash_code)
 
     @property
     def uuid(self):
@@ -575,14 +937,42 @@ class Model(object):
         """
         return self.dependency.hasAttribute(name)
 
-    @decorator.memoize
     def get_attribute(self, name):
         """
+        Attributes are cached on the instance using the provided name as a
+        key. Attributes that cannot be found are not stored in the cache so
+        they can be retrieved once they are added to the node.
+
+        :param str name:
+        :return: Attribute
+        :rtype: OpenMaya.MObject
+        """
+        if name in self._cache_attributes:
+            self._cache_hits += 1
+        else:
+            self._cache_misses += 1
+
+        return self._find_attribute(name)
+
+    def _find_attribute(self, name):
+        """
+        Retrieve the attribute from the cache, or from the node when it is
+        not cached yet, without counting the lookup as a hit or a miss.
+
         :param str name:
         :return: Attribute
         :rtype: OpenMaya.MObject
         """
-        return self.dependency.attribute(name)
+        try:
+            return self._cache_attributes[name]
+        except KeyError:
+            pass
+
+        attribute = self.dependency.attribute(name)
+        if not attribute.isNull():
+            self._cache_attributes[name] = attribute
+
+        return attribute
 
     def add_attribute(self, attribute):
         """
@@ -625,17 +1015,35 @@ class Model(object):
 
     # ------------------------------------------------------------------------
 
-    @decorator.memoize
     def get_plug(self, name):
         """
+        Plugs are cached on the instance using the provided name as a key.
+        The cache is cleared when attributes are added or removed using the
+        add_attribute and delete_attribute functions. Plugs are resolved
+        directly from the dependency node and its cached attribute, only
+        names that point to elements or children of a plug, for example
+        'value[0]' or 'value[0].valueX' fall back to a string lookup.
+
         :param str name:
         :return: Plug
         :rtype: OpenMaya.MPlug
         :raise RuntimeError: When the attribute doesn't exist on the node.
         """
         try:
-            node = path.get(self.object, full_path=True)
-            return api.get_plug("{}.{}".format(node, name))
+            plug = self._cache_plugs[name]
+        except KeyError:
+            self._cache_misses += 1
+        else:
+            self._cache_hits += 1
+            return plug
+
+        try:
+            if "[" in name or "." in name:
+                node = path.get(self.object, full_path=True)
+                plug = api.get_plug("{}.{}".format(node, name))
+            else:
+                attribute = self._find_attribute(name)
+                plug = api.find_plug(self.dependency, attribute)
         except RuntimeError:
             raise RuntimeError(
                 "Attribute '{}' doesn't exist on node '{}'.".format(
@@ -644,8 +1052,75 @@ class Model(object):
                 )
             )
 
+        self._cache_plugs[name] = plug
+        return plug
+
+    def get_plug_child(self, name, index):
+        """
+        :param str name:
+        :param int index:
+        :return: Child plug of a compound plug
+        :rtype: OpenMaya.MPlug
+        :raise RuntimeError: When the attribute doesn't exist on the node.
+        """
+        plug = self.get_plug(name)
+        return api.get_plug_child(plug, index)
+
+    def get_plug_element(self, name, index):
+        """
+        :param str name:
+        :param int index:
+        :return: Element plug of an array plug using the logical index
+        :rtype: OpenMaya.MPlug
+        :raise RuntimeError: When the attribute doesn't exist on the node.
+        """
+        plug = self.get_plug(name)
+        return api.get_plug_element(plug, index)
+
     # ------------------------------------------------------------------------
 
+    def get_schema(self):
+        """
+        :return: Schema stored on the node
+        :rtype: str/None
+        """
+        if not self.has_attribute(SCHEMA):
+            return None
+
+        return self.get_plug(SCHEMA).asString()
+
+    def set_schema(self):
+        """
+        Store the schema of the type on the node, the schema attribute will
+        be created if it doesn't exist yet.
+        """
+        if not self.has_attribute(SCHEMA):
+            self.add_attribute(create_tag_attribute(SCHEMA))
+
+        with api.MDGModifier() as modifier:
+            modifier.newPlugValueString(self.get_plug(SCHEMA), self.__class__.schema)
+
+    # ------------------------------------------------------------------------
+
+    def create_callbacks(self):
+        """
+        Create the callbacks for this instance. This function is only called
+        when the node_callbacks attribute is set to True.
+        """
+        self.create_callback(
+            OpenMaya.MNodeMessage.addNodeDestroyedCallback,
+            self.object,
+            self._emit_deleted,
+            None
+        )
+
+        self.create_callback(
+            OpenMaya.MNodeMessage.addNodeAboutToDeleteCallback,
+            self.object,
+            self._emit_deleted,
+            None
+        )
+
     def create_callback(self, callback, *args, **kwargs):
         """
         :param callback:
@@ -668,6 +1143,30 @@ class Model(object):
 
     # ------------------------------------------------------------------------
 
+    def get_index(self, name):
+        """
+        :param str name:
+        :return: Index of the field
+        :rtype: indexes.Index/None
+        """
+        return self._indexes.get(name)
+
+    def update_indexes(self):
+        """
+        Read the values of all indexed fields and update the indexes.
+        """
+        for index in self._indexes.values():
+            index.update(self)
+
+    def discard_indexes(self):
+        """
+        Remove the instance from all indexes.
+        """
+        for index in self._indexes.values():
+            index.discard(self)
+
+    # ------------------------------------------------------------------------
+
     def pop_cache(self, item):
         """
         Pop an attribute name from the cache list. This function will remove
@@ -676,16 +1175,55 @@ class Model(object):
 
         :param str item:
         """
-        self.get_attribute.pop(self, item)
-        self.get_plug.pop(self, item)
+        self._cache_attributes.pop(item, None)
+        self._cache_plugs.pop(item, None)
 
     def delete_cache(self):
         """
-        Delete the cache from any functions that have a memoize decorator
-        attached to them.
+        Delete the attribute and plug caches stored on the instance.
+        """
+        self._cache_attributes.clear()
+        self._cache_plugs.clear()
+
+    def cache_info(self):
+        """
+        :return: Cache hits, misses and the number of cached attributes and plugs
+        :rtype: CacheInfo
         """
-        self.get_attribute.clear()
-        self.get_plug.clear()
+        return CacheInfo(
+            self._cache_hits,
+            self._cache_misses,
+            len(self._cache_attributes),
+            len(self._cache_plugs),
+        )
+
+    # ------------------------------------------------------------------------
+
+    def update(self, **values):
+        """
+        Set the values of multiple fields using a single modifier, which
+        results in a single undo entry. All values are validated before any
+        of the values are set.
+
+        :raise TypeError: When a key is not a field of the model.
+        """
+        self.__class__.objects.bulk_update([self], **{key: {self: value} for key, value in values.items()})
+
+    def traverse(self, name, depth=None, direction="forward"):
+        """
+        Walk the relation of the provided name breadth first starting at the
+        model, for example to retrieve all children in a hierarchy of models.
+        Every model is returned once and the model itself is not returned.
+
+        :param str name:
+        :param int/None depth:
+        :param str direction: "forward" or "reverse"
+        :return: Models
+        :rtype: generator[models.Model]
+        :raise ValueError: When the direction is not forward or reverse.
+        :raise ValueError: When none of the models have the relation.
+        """
+        return query.traverse([self], name, depth=depth, direction=direction)
 
     # ------------------------------------------------------------------------
 
@@ -703,6 +1241,9 @@ class Model(object):
         if self.has_attribute("mango"):
             self.delete_attribute("mango")
 
+        if self.has_attribute(SCHEMA):
+            self.delete_attribute(SCHEMA)
+
         # invalidate node by deleting the callbacks and removing the instance
         # from the caches.
         self._emit_deleted()
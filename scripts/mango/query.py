@@ -0,0 +1,604 @@
+import itertools
+
+from mango import lookups
+
+
+__all__ = [
+    "QuerySet",
+]
+
+
+def import_numpy():
+    """
+    :return: NumPy module
+    :rtype: module
+    :raise ImportError: When NumPy is not available.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is required to read values into arrays.")
+
+    return numpy
+
+
+def get_value(obj, key):
+    """
+    Get the value of the provided key from the object, if the value is a
+    function or method it will be called to retrieve the value.
+
+    :param models.Model obj:
+    :param str key:
+    :return: Value
+    """
+    return lookups.get_accessor(obj.__class__, key)(obj)
+
+
+def prefetch_related(models, lookup):
+    """
+    Prefetch the models of the relations in the lookup. The lookup can span
+    multiple relations separated by double underscores, for example
+    'joint_set__link'. Every relation is resolved for all models in a single
+    pass, the resolved models are stored in the cache of the managers and
+    are used as the models of the next relation in the lookup. Models that
+    don't have the relation are skipped.
+
+    :param list[models.Model] models:
+    :param str lookup:
+    """
+    for name in lookup.split("__"):
+        models_seen = set()
+        models_related = []
+        for model in models:
+            relation = model.relations.get(name)
+            if relation is None:
+                continue
+
+            manager = relation.get_manager_from_instance(model)
+            for model_related in manager.prefetch():
+                if model_related not in models_seen:
+                    models_seen.add(model_related)
+                    models_related.append(model_related)
+
+        models = models_related
+
+
+def traverse(models, name, depth=None, direction="forward"):
+    """
+    Walk the relation of the provided name breadth first starting at the
+    provided models. The walk visits every model once which prevents
+    cycles from looping, the provided models themselves are not returned.
+    When the direction is reverse the relation of which the reverse name
+    matches the provided name is followed instead, this allows for the walk
+    to continue across types.
+
+    Every level of the walk is resolved as a batch, the plugs of all models
+    in the frontier are retrieved first after which the connections of all
+    plugs are read and resolved through the registry in a single loop. The
+    models of a level are only returned once the level is resolved.
+
+    :param iterable models:
+    :param str name:
+    :param int/None depth:
+    :param str direction: "forward" or "reverse"
+    :return: Models
+    :rtype: generator[models.Model]
+    :raise ValueError: When the direction is not forward or reverse.
+    :raise ValueError: When none of the provided models have the relation.
+    """
+    def get_relation(cls):
+        """
+        :param type cls:
+        :return: Relation to follow
+        :rtype: relations.Relation/None
+        """
+        if cls not in relations:
+            if direction == "forward":
+                relations[cls] = cls.relations.get(name)
+            else:
+                relations[cls] = next((r for r in cls.relations.values() if r.rev_name == name), None)
+
+        return relations[cls]
+
+    if direction not in ("forward", "reverse"):
+        raise ValueError("Direction '{}' is not supported, options are 'forward' or 'reverse'.".format(direction))
+
+    relations = {}
+    frontier = list(models)
+    visited = set(frontier)
+    level = 0
+
+    while frontier and (depth is None or level < depth):
+        level += 1
+
+        # get plugs
+        plugs = []
+        for model in frontier:
+            relation = get_relation(model.__class__)
+            if relation is not None:
+                plugs.append((relation, model.get_plug(relation.name)))
+
+        if level == 1 and not plugs:
+            raise ValueError("Unable to traverse, no model has a relation '{}' in the {} direction.".format(
+                name,
+                direction
+            ))
+
+        # resolve connections
+        models_related = []
+        for relation, plug in plugs:
+            if plug.isArray:
+                elements = [plug.elementByLogicalIndex(index) for index in plug.getExistingArrayAttributeIndices()]
+            else:
+                elements = [plug]
+
+            for element in elements:
+                for plug_connected in element.connectedTo(relation.rev, not relation.rev):
+                    model_related = relation.cls.resolve(plug_connected.node())
+                    if model_related not in visited:
+                        visited.add(model_related)
+                        models_related.append(model_related)
+
+        for model_related in models_related:
+            yield model_related
+
+        frontier = models_related
+
+
+class QuerySet(object):
+    """
+    The query set is a lazy representation of the models of a manager. It
+    is possible to chain filters, excludes and orderings which will only be
+    evaluated once the models are requested. Slicing a query set that has
+    not been evaluated will not retrieve the models beyond the slice and
+    the count, exists and first functions will stop as soon as the answer
+    is known. The models are cached after the query set is fully evaluated.
+
+    Query sets support the &, | and - operators to retrieve the
+    intersection, union and difference with any other iterable of models.
+    The models are hashed which makes these operations run in linear time.
+    The resulting models are used as the base of the returned query set,
+    any filters, orderings and slices chained onto it are applied to these
+    models only.
+
+    Relations can be prefetched for the models that are returned by the
+    query set, this populates the caches of the relation managers of the
+    models so iterating the relations doesn't require any further reads of
+    the connections. The caches are shared by all query sets as there is
+    only a single model per node, they are cleared once the connections of
+    the relations change.
+
+    When the manager is able to resolve any of the filters using an index
+    the smallest set of models returned by the indexes is used as the base
+    of the query, all filters are still applied to these models.
+    """
+    def __init__(self, manager, models=None):
+        self.manager = manager
+
+        self._filters = []
+        self._order_by = ()
+        self._slice = None
+        self._prefetch = ()
+        self._base = list(models) if models is not None else None
+        self._result_cache = None
+        self._result_set = None
+
+    def __repr__(self):
+        models = list(itertools.islice(self._iter(), 21))
+        if len(models) > 20:
+            models[-1] = "...(remaining elements truncated)..."
+
+        return "<{}.{} {}>".format(
+            self.__class__.__module__,
+            self.__class__.__name__,
+            models
+        )
+
+    def __iter__(self):
+        self._fetch_all()
+        return iter(self._result_cache)
+
+    def __len__(self):
+        self._fetch_all()
+        return len(self._result_cache)
+
+    def __bool__(self):
+        return self.exists()
+
+    __nonzero__ = __bool__
+
+    def __contains__(self, item):
+        self._fetch_all()
+        if self._result_set is None:
+            self._result_set = set(self._result_cache)
+
+        return item in self._result_set
+
+    def __eq__(self, other):
+        if isinstance(other, (QuerySet, list, tuple)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __and__(self, other):
+        """
+        :param iterable other:
+        :return: Models that are part of both
+        :rtype: QuerySet
+        """
+        models = set(other)
+        return self.__class__(self.manager, [model for model in self if model in models])
+
+    def __or__(self, other):
+        """
+        :param iterable other:
+        :return: Models that are part of either
+        :rtype: QuerySet
+        """
+        models = list(self)
+        models_seen = set(models)
+        for model in other:
+            if model not in models_seen:
+                models_seen.add(model)
+                models.append(model)
+
+        return self.__class__(self.manager, models)
+
+    def __sub__(self, other):
+        """
+        :param iterable other:
+        :return: Models that are not part of the other
+        :rtype: QuerySet
+        """
+        models = set(other)
+        return self.__class__(self.manager, [model for model in self if model not in models])
+
+    def __getitem__(self, item):
+        """
+        :param int/slice item:
+        :return: Model or query set of the slice
+        :rtype: models.Model/QuerySet
+        :raise TypeError: When item is not an integer or slice.
+        :raise IndexError: When item is out of range.
+        """
+        if not isinstance(item, (int, slice)):
+            raise TypeError("QuerySet indices must be integers or slices, not {}.".format(type(item).__name__))
+
+        if self._result_cache is not None:
+            return self._result_cache[item]
+
+        if isinstance(item, slice):
+            if (item.start or 0) < 0 or (item.stop or 0) < 0 or item.step not in (None, 1):
+                return list(self)[item]
+
+            # compose the slice with any existing slice, the slice is
+            # relative to the models of the existing slice.
+            offset, limit = self._slice or (0, None)
+            start = offset + (item.start or 0)
+            stop = limit if item.stop is None else offset + item.stop
+            if limit is not None and stop is not None:
+                stop = min(limit, stop)
+
+            query = self._clone()
+            query._slice = (start, stop)
+            return query
+
+        if item < 0:
+            return list(self)[item]
+
+        try:
+            model = next(itertools.islice(self._iter(), item, None))
+        except StopIteration:
+            raise IndexError("QuerySet index out of range.")
+
+        self._prefetch_related([model])
+        return model
+
+    # ------------------------------------------------------------------------
+
+    def _clone(self):
+        """
+        :return: Copy of the query set without its cache
+        :rtype: QuerySet
+        """
+        query = self.__class__(self.manager)
+        query._base = self._base
+        query._filters = self._filters[:]
+        query._order_by = self._order_by
+        query._slice = self._slice
+        query._prefetch = self._prefetch
+        return query
+
+    def _iter(self):
+        """
+        :return: Models
+        :rtype: generator[models.Model]
+        """
+        if self._result_cache is not None:
+            for model in self._result_cache:
+                yield model
+            return
+
+        models = self._iter_base()
+        for _, match, negate in self._filters:
+            models = self._iter_filter(models, match, negate)
+
+        if self._order_by:
+            models = list(models)
+            for key in reversed(self._order_by):
+                reverse = key.startswith("-")
+                key = key.lstrip("-")
+                models.sort(key=lambda model: get_value(model, key), reverse=reverse)
+
+        if self._slice is not None:
+            models = itertools.islice(models, *self._slice)
+
+        for model in models:
+            yield model
+
+    def _iter_base(self):
+        """
+        :return: Models to apply the filters on
+        :rtype: iterator[models.Model]
+        """
+        if self._base is not None:
+            return iter(self._base)
+
+        base = None
+        for kwargs, _, negate in self._filters:
+            if negate:
+                continue
+
+            for key, value in kwargs.items():
+                models = self.manager.lookup_index(key, value)
+                if models is not None and (base is None or len(models) < len(base)):
+                    base = models
+
+        return self.manager.all_iter() if base is None else iter(base)
+
+    @staticmethod
+    def _iter_filter(models, match, negate):
+        """
+        :param iterable models:
+        :param callable match:
+        :param bool negate:
+        :return: Filtered models
+        :rtype: generator[models.Model]
+        """
+        for model in models:
+            if match(model) is not negate:
+                yield model
+
+    def _fetch_all(self):
+        if self._result_cache is None:
+            self._result_cache = list(self._iter())
+            self._prefetch_related(self._result_cache)
+
+    def _prefetch_related(self, models):
+        """
+        :param list[models.Model] models:
+        """
+        for lookup in self._prefetch:
+            prefetch_related(models, lookup)
+
+    def _validate_not_sliced(self, name):
+        """
+        :param str name:
+        :raise TypeError: When the query set is sliced.
+        """
+        if self._slice is not None:
+            raise TypeError("Cannot {} a query once a slice has been taken.".format(name))
+
+    # ------------------------------------------------------------------------
+
+    def all(self):
+        """
+        :return: Copy of the query set
+        :rtype: QuerySet
+        """
+        return self._clone()
+
+    def filter(self, **kwargs):
+        """
+        :return: Query set filtered using the keyword arguments
+        :rtype: QuerySet
+        :raise RuntimeError: When the provided lookup cannot be found.
+        :raise TypeError: When the query set is sliced.
+        """
+        self._validate_not_sliced("filter")
+        query = self._clone()
+        query._filters.append((kwargs, lookups.compile_filter(**kwargs), False))
+        return query
+
+    def exclude(self, **kwargs):
+        """
+        :return: Query set excluding the models matching the keyword arguments
+        :rtype: QuerySet
+        :raise RuntimeError: When the provided lookup cannot be found.
+        :raise TypeError: When the query set is sliced.
+        """
+        self._validate_not_sliced("exclude")
+        query = self._clone()
+        query._filters.append((kwargs, lookups.compile_filter(**kwargs), True))
+        return query
+
+    def order_by(self, *keys):
+        """
+        Order the models using the provided keys, when a key is prefixed
+        with '-' the order is reversed.
+
+        :return: Ordered query set
+        :rtype: QuerySet
+        :raise TypeError: When the query set is sliced.
+        """
+        self._validate_not_sliced("reorder")
+        query = self._clone()
+        query._order_by = keys
+        return query
+
+    def traverse(self, name, depth=None, direction="forward"):
+        """
+        Walk the relation of the provided name breadth first starting at the
+        models of the query set, see traverse.
+
+        :param str name:
+        :param int/None depth:
+        :param str direction: "forward" or "reverse"
+        :return: Models
+        :rtype: generator[models.Model]
+        :raise ValueError: When the direction is not forward or reverse.
+        :raise ValueError: When none of the models have the relation.
+        """
+        return traverse(self, name, depth=depth, direction=direction)
+
+    def prefetch_related(self, *lookups):
+        """
+        Prefetch the related models of the provided lookups for the models
+        that are returned by the query set, for example
+        prefetch_related('joint_set__link').
+
+        :param str lookups:
+        :return: Query set that prefetches the related models
+        :rtype: QuerySet
+        """
+        query = self._clone()
+        query._prefetch = self._prefetch + lookups
+        if self._result_cache is not None:
+            query._result_cache = self._result_cache
+            for lookup in lookups:
+                prefetch_related(query._result_cache, lookup)
+
+        return query
+
+    # ------------------------------------------------------------------------
+
+    def count(self):
+        """
+        :return: Number of models
+        :rtype: int
+        """
+        if self._result_cache is not None:
+            return len(self._result_cache)
+        elif self._base is None and not self._filters and self._slice is None:
+            return self.manager.count()
+
+        return sum(1 for _ in self._iter())
+
+    def exists(self):
+        """
+        :return: If the query set contains any models
+        :rtype: bool
+        """
+        if self._result_cache is not None:
+            return bool(self._result_cache)
+        elif self._base is None and not self._filters and self._slice is None:
+            return self.manager.exists()
+
+        return next(self._iter(), None) is not None
+
+    def first(self):
+        """
+        :return: First model of the query set
+        :rtype: models.Model/None
+        """
+        if self._result_cache is not None:
+            return self._result_cache[0] if self._result_cache else None
+
+        model = next(self._iter(), None)
+        if model is not None:
+            self._prefetch_related([model])
+
+        return model
+
+    def get(self, **kwargs):
+        """
+        :return: First model matching the keyword arguments
+        :rtype: models.Model/None
+        """
+        query = self.filter(**kwargs) if kwargs else self
+        return query.first()
+
+    # ------------------------------------------------------------------------
+
+    def values_list(self, *keys, **kwargs):
+        """
+        Read the values of the provided keys for every model in a single
+        pass. The accessors are resolved once per model class, fields are
+        read directly from their plugs. When flat is set to True and a
+        single key is provided a list of values is returned instead of a
+        list of tuples.
+
+        :param str keys:
+        :param bool flat:
+        :return: Values
+        :rtype: list
+        :raise TypeError: When flat is used with more than one key.
+        """
+        flat = kwargs.pop("flat", False)
+        if kwargs:
+            raise TypeError("values_list() got unexpected keyword argument(s) '{}'.".format("', '".join(kwargs)))
+        elif flat and len(keys) != 1:
+            raise TypeError("values_list() with flat requires a single key.")
+
+        accessors = {}
+        values = []
+        for model in self._iter():
+            cls = model.__class__
+            getters = accessors.get(cls)
+            if getters is None:
+                getters = accessors[cls] = [lookups.get_accessor(cls, key) for key in keys]
+
+            if flat:
+                values.append(getters[0](model))
+            else:
+                values.append(tuple(getter(model) for getter in getters))
+
+        return values
+
+    def values_array(self, *keys):
+        """
+        Read the values of the provided keys for every model into a NumPy
+        array. The data type is taken from the fields of the manager's
+        class, keys that are not a field are stored as objects. A single key
+        returns an array of shape (N,) or (N, k) for compound fields, multiple
+        keys return a structured array with the keys as names.
+
+        :param str keys:
+        :return: Values
+        :rtype: numpy.ndarray
+        :raise ImportError: When NumPy is not available.
+        :raise TypeError: When no keys are provided.
+        """
+        if not keys:
+            raise TypeError("values_array() requires at least one key.")
+
+        numpy = import_numpy()
+        fields = getattr(self.manager.cls, "fields", None) or {}
+
+        dtypes = []
+        for key in keys:
+            field = fields.get(key)
+            if field is None or field.array:
+                dtypes.append((key, "O"))
+            elif field.compound:
+                dtypes.append((key, field.dtype, (len(field.compound),)))
+            else:
+                dtypes.append((key, field.dtype))
+
+        if len(keys) == 1:
+            values = self.values_list(keys[0], flat=True)
+            if dtypes[0][1] == "O":
+                array = numpy.empty(len(values), dtype=object)
+                for i, value in enumerate(values):
+                    array[i] = value
+
+                return array
+
+            shape = (len(values),) + (dtypes[0][2] if len(dtypes[0]) > 2 else ())
+            return numpy.array(values, dtype=dtypes[0][1]).reshape(shape)
+
+        return numpy.array(self.values_list(*keys), dtype=dtypes)
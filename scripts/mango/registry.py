@@ -0,0 +1,517 @@
+import sys
+from maya.api import OpenMaya
+
+
+__all__ = [
+    "Registry",
+]
+
+
+class Registry(object):
+    """
+    The registry keeps track of all initialized models. Models are stored
+    using the integer hash code of their OpenMaya.MObjectHandle as a key. As
+    hash codes are not guaranteed to be unique, any models that collide with
+    an existing key are stored separately and resolved by comparing the
+    handles. The type buckets only store the keys of the models that belong
+    to that type, the models themselves are only referenced once.
+
+    The handles are used as weak references to the nodes in the scene. When
+    a model is retrieved of which the node is no longer valid it will be
+    pruned from the registry.
+
+    A single scene level callback is registered once the first model is
+    added. This callback will look up the model of any node that is removed
+    from the scene and invalidate it, this prevents every model from having
+    to register its own callbacks. The same approach is used to invalidate
+    the relation caches when connections change and to invalidate the
+    indexes of the types when an undo or redo is performed.
+
+    Maya has no scene level message for attribute changes, models of types
+    with indexed fields therefore get an attribute changed callback that is
+    owned by the registry. The callback notifies the model when an indexed
+    attribute is set or its connections change, so the indexes stay fresh
+    when values are edited outside of mango. These callbacks only exist
+    while the index callbacks are registered, the indexes are not trusted
+    otherwise.
+
+    The number of models per type is tracked when models are added and
+    removed, this allows for the models of a type to be counted without
+    iterating them.
+
+    Nodes can be registered as pending using their handle and type tag,
+    these nodes are not yet initialized as models. This allows for the
+    scene to be processed without having to construct every model, the
+    pending nodes are initialized once the models are requested.
+    """
+    def __init__(self):
+        self._models = {}
+        self._collisions = {}
+        self._types = {}
+        self._counts = {}
+        self._pending = {}
+        self._callbacks = []
+        self._callbacks_connection = []
+        self._callbacks_index = []
+        self._callbacks_attribute = {}
+        self._indexes = []
+
+    def __repr__(self):
+        return "<{}.{}: {} models>".format(
+            self.__class__.__module__,
+            self.__class__.__name__,
+            len(self)
+        )
+
+    def __len__(self):
+        """
+        :return: Number of registered models
+        :rtype: int
+        """
+        return len(self._models) + sum(len(models) for models in self._collisions.values())
+
+    def __iter__(self):
+        """
+        :return: Registered models
+        :rtype: generator[models.Model]
+        """
+        for key in list(self._models.keys()):
+            for model in self._get_models(key):
+                yield model
+
+    # ------------------------------------------------------------------------
+
+    def _get_models(self, key):
+        """
+        :param int key:
+        :return: Models stored using the provided key
+        :rtype: list[models.Model]
+        """
+        model = self._models.get(key)
+        if model is None:
+            return []
+
+        return [model] + self._collisions.get(key, [])
+
+    # ------------------------------------------------------------------------
+
+    def _find(self, handle):
+        """
+        :param OpenMaya.MObjectHandle handle:
+        :return: Model stored using the provided handle
+        :rtype: models.Model/None
+        """
+        key = handle.hashCode()
+        model = self._models.get(key)
+        if model is None:
+            return None
+
+        if key in self._collisions:
+            for model in self._get_models(key):
+                if model.handle == handle:
+                    return model
+
+            return None
+        elif model.handle != handle:
+            return None
+
+        return model
+
+    # ------------------------------------------------------------------------
+
+    def _emit_node_removed(self, m_object, *args):
+        """
+        :param OpenMaya.MObject m_object:
+        """
+        model = self._find(OpenMaya.MObjectHandle(m_object))
+        if model is not None:
+            model._emit_deleted()
+
+    def _emit_connection(self, plug_source, plug_destination, made, *args):
+        """
+        :param OpenMaya.MPlug plug_source:
+        :param OpenMaya.MPlug plug_destination:
+        :param bool made:
+        """
+        for plug in (plug_source, plug_destination):
+            model = self._find(OpenMaya.MObjectHandle(plug.node()))
+            if model is not None:
+                model._emit_connection_changed(plug)
+
+    def _emit_attribute_changed(self, message, plug, plug_other, *args):
+        """
+        :param int message:
+        :param OpenMaya.MPlug plug:
+        :param OpenMaya.MPlug plug_other:
+        """
+        if not message & (
+            OpenMaya.MNodeMessage.kAttributeSet
+            | OpenMaya.MNodeMessage.kConnectionMade
+            | OpenMaya.MNodeMessage.kConnectionBroken
+        ):
+            return
+
+        model = self._find(OpenMaya.MObjectHandle(plug.node()))
+        if model is not None:
+            model._emit_attribute_changed(plug)
+
+    def _emit_undo(self, *args):
+        """
+        Invalidate all indexes, the values that were changed by the undo or
+        redo are unknown.
+        """
+        for index in self._indexes:
+            index.invalidate()
+
+    def _emit_scene_cleared(self, *args):
+        """
+        Invalidate all models and remove them from the registry, this keeps
+        the counts accurate when the scene is replaced.
+        """
+        for model in list(self):
+            model._emit_deleted()
+
+        self.clear()
+
+    def register_callbacks(self):
+        """
+        Register the scene level callbacks that invalidate models when their
+        node is removed from the scene or when the scene is replaced. If the
+        callbacks are already registered nothing will happen.
+        """
+        if self._callbacks:
+            return
+
+        self._callbacks.append(
+            OpenMaya.MDGMessage.addNodeRemovedCallback(
+                self._emit_node_removed,
+                "dependNode"
+            )
+        )
+
+        for message in (OpenMaya.MSceneMessage.kBeforeNew, OpenMaya.MSceneMessage.kBeforeOpen):
+            self._callbacks.append(
+                OpenMaya.MSceneMessage.addCallback(
+                    message,
+                    self._emit_scene_cleared
+                )
+            )
+
+    def register_connection_callbacks(self):
+        """
+        Register the scene level callback that notifies models when the
+        connections of their plugs change. This callback is only registered
+        once a relation cache is used. If the callback is already registered
+        nothing will happen.
+        """
+        if self._callbacks_connection:
+            return
+
+        self._callbacks_connection.append(
+            OpenMaya.MDGMessage.addConnectionCallback(
+                self._emit_connection
+            )
+        )
+
+    def register_index(self, index):
+        """
+        Register an index that is invalidated when an undo or redo is
+        performed. The index callbacks are registered once the first index
+        is registered.
+
+        :param indexes.Index index:
+        """
+        self._indexes.append(index)
+        self.register_index_callbacks()
+
+    def register_index_callbacks(self):
+        """
+        Register the event callbacks that invalidate the indexes when an
+        undo or redo is performed and the attribute changed callbacks of
+        all registered models with indexed fields. As changes made while
+        the callbacks were not registered are unknown all indexes are
+        invalidated. If the callbacks are already registered nothing will
+        happen.
+        """
+        if self._callbacks_index:
+            return
+
+        for event in ("Undo", "Redo"):
+            self._callbacks_index.append(
+                OpenMaya.MEventMessage.addEventCallback(
+                    event,
+                    self._emit_undo
+                )
+            )
+
+        for model in self:
+            self._register_attribute_callback(model)
+
+        self._emit_undo()
+
+    def _register_attribute_callback(self, model):
+        """
+        :param models.Model model:
+        """
+        if not model._indexes or id(model) in self._callbacks_attribute:
+            return
+
+        self._callbacks_attribute[id(model)] = OpenMaya.MNodeMessage.addAttributeChangedCallback(
+            model.object,
+            self._emit_attribute_changed
+        )
+
+    def _remove_attribute_callback(self, model):
+        """
+        :param models.Model model:
+        """
+        callback = self._callbacks_attribute.pop(id(model), None)
+        if callback is not None:
+            OpenMaya.MMessage.removeCallback(callback)
+
+    def has_connection_callbacks(self):
+        """
+        :return: If the connection changes are tracked
+        :rtype: bool
+        """
+        return bool(self._callbacks_connection)
+
+    def has_index_callbacks(self):
+        """
+        :return: If the changes of indexed attributes are tracked
+        :rtype: bool
+        """
+        return bool(self._callbacks_index)
+
+    def delete_callbacks(self):
+        """
+        Remove the scene level callbacks.
+        """
+        if self._callbacks:
+            OpenMaya.MMessage.removeCallbacks(self._callbacks)
+            self._callbacks = []
+        if self._callbacks_connection:
+            OpenMaya.MMessage.removeCallbacks(self._callbacks_connection)
+            self._callbacks_connection = []
+        if self._callbacks_index:
+            OpenMaya.MMessage.removeCallbacks(self._callbacks_index)
+            self._callbacks_index = []
+        if self._callbacks_attribute:
+            OpenMaya.MMessage.removeCallbacks(list(self._callbacks_attribute.values()))
+            self._callbacks_attribute = {}
+
+    # ------------------------------------------------------------------------
+
+    def get(self, handle):
+        """
+        Get the model that belongs to the provided handle. If the model is
+        found but its node is no longer valid the model will be removed from
+        the registry.
+
+        :param OpenMaya.MObjectHandle handle:
+        :return: Model
+        :rtype: models.Model/None
+        """
+        model = self._find(handle)
+        if model is None:
+            return None
+        elif not model.handle.isValid():
+            self.remove(model)
+            return None
+
+        return model
+
+    def add(self, model):
+        """
+        Add a model to the registry. When the key of the model is already
+        in use by a model of which the node is still valid the model will be
+        stored as a collision. If the model is already registered nothing
+        will happen.
+
+        :param models.Model model:
+        """
+        self.register_callbacks()
+
+        key = model.hash_code
+        if any(m is model for m in self._get_models(key)):
+            return
+
+        existing = self._models.get(key)
+        if existing is None:
+            self._models[key] = model
+        elif existing.handle == model.handle or not existing.handle.isValid():
+            self.remove(existing)
+            self.add(model)
+            return
+        else:
+            self._collisions.setdefault(key, []).append(model)
+
+        self._types.setdefault(model.type, set()).add(key)
+        self._counts[model.type] = self._counts.get(model.type, 0) + 1
+
+        if self._callbacks_index:
+            self._register_attribute_callback(model)
+
+    def remove(self, model):
+        """
+        Remove a model from the registry, if the model is not registered
+        nothing will happen.
+
+        :param models.Model model:
+        """
+        key = model.hash_code
+        models = self._get_models(key)
+        if not any(m is model for m in models):
+            return
+
+        self._remove_attribute_callback(model)
+
+        # remove model, models are compared by identity to make sure only
+        # this instance is removed.
+        models = [m for m in models if m is not model]
+        if models:
+            self._models[key] = models[0]
+            self._collisions[key] = models[1:]
+        else:
+            self._models.pop(key, None)
+
+        if not self._collisions.get(key):
+            self._collisions.pop(key, None)
+
+        count = self._counts.get(model.type, 0) - 1
+        if count > 0:
+            self._counts[model.type] = count
+        else:
+            self._counts.pop(model.type, None)
+
+        # remove key from type, a key is shared between types when its
+        # models collide.
+        if not any(m.type == model.type for m in models):
+            keys = self._types.get(model.type)
+            if keys is not None:
+                keys.discard(key)
+
+    def prune(self):
+        """
+        Remove all models and pending nodes from the registry of which the
+        node is no longer valid.
+
+        :return: Number of pruned models
+        :rtype: int
+        """
+        models = [model for model in self if not model.handle.isValid()]
+        for model in models:
+            self.remove(model)
+
+        for type_value, handles in list(self._pending.items()):
+            handles = [handle for handle in handles if handle.isValid()]
+            if handles:
+                self._pending[type_value] = handles
+            else:
+                self._pending.pop(type_value)
+
+        return len(models)
+
+    def clear(self):
+        """
+        Remove all models and pending nodes from the registry.
+        """
+        if self._callbacks_attribute:
+            OpenMaya.MMessage.removeCallbacks(list(self._callbacks_attribute.values()))
+            self._callbacks_attribute = {}
+
+        self._models.clear()
+        self._collisions.clear()
+        self._types.clear()
+        self._counts.clear()
+        self._pending.clear()
+
+    # ------------------------------------------------------------------------
+
+    def add_pending(self, handle, type_value):
+        """
+        Register a node that is not yet initialized as a model. The type
+        value is the module and class name stored in the mango attribute of
+        the node.
+
+        :param OpenMaya.MObjectHandle handle:
+        :param str type_value:
+        """
+        self._pending.setdefault(type_value, []).append(handle)
+
+    def has_pending(self):
+        """
+        :return: If any pending nodes are registered
+        :rtype: bool
+        """
+        return bool(self._pending)
+
+    def pending_types(self):
+        """
+        :return: Type values of the pending nodes
+        :rtype: list[str]
+        """
+        return list(self._pending.keys())
+
+    def pop_pending(self, type_value):
+        """
+        Remove and return the pending nodes of the provided type value, any
+        nodes that are no longer valid are omitted.
+
+        :param str type_value:
+        :return: Pending nodes
+        :rtype: list[OpenMaya.MObjectHandle]
+        """
+        handles = self._pending.pop(type_value, [])
+        return [handle for handle in handles if handle.isValid()]
+
+    # ------------------------------------------------------------------------
+
+    def iter_type(self, name):
+        """
+        Iterate the models of the provided type, models of which the node is
+        no longer valid are pruned from the registry.
+
+        :param str name:
+        :return: Models that are of the provided type
+        :rtype: generator[models.Model]
+        """
+        keys = self._types.get(name)
+        if not keys:
+            return
+
+        for key in list(keys):
+            for model in self._get_models(key):
+                if model.type != name:
+                    continue
+                elif not model.handle.isValid():
+                    self.remove(model)
+                    continue
+
+                yield model
+
+    def count_type(self, name):
+        """
+        :param str name:
+        :return: Number of models of the provided type
+        :rtype: int
+        """
+        return self._counts.get(name, 0)
+
+    # ------------------------------------------------------------------------
+
+    def memory_usage(self):
+        """
+        Get the memory footprint of the registry containers in bytes, the
+        models themselves are not included in this number.
+
+        :return: Memory footprint
+        :rtype: int
+        """
+        size = sys.getsizeof(self._models)
+        size += sys.getsizeof(self._collisions)
+        size += sum(sys.getsizeof(models) for models in self._collisions.values())
+        size += sys.getsizeof(self._types)
+        size += sum(sys.getsizeof(keys) for keys in self._types.values())
+        size += sys.getsizeof(self._counts)
+        return size
@@ -1,3 +1,4 @@
+
 from mango import managers
 from mango.relations.constants import CASCADE
 from mango.utils import naming
@@ -13,6 +14,10 @@ class Relation(object):
     The relationship class is the base descriptor that can be subclassed and
     used in the models. The descriptors have the possibility to link to other
     classes and it is possible to add a reverse link as well.
+
+    When the cache flag is set the managers store the resolved models, the
+    cache is invalidated by the registry when the connections of the
+    relation's attribute change.
     """
     def __init__(
             self,
@@ -28,6 +33,7 @@ class Relation(object):
             on_delete=CASCADE,
             multi=False,
             validators=(),
+            cache=False,
     ):
         self.cls = cls
         self.name = name
@@ -42,6 +48,7 @@ class Relation(object):
         self.on_delete = on_delete
         self.multi = multi
         self.validators = validators
+        self.cache = cache
 
     def __repr__(self):
         path = "{}.{}".format(self.__class__.__module__, self.__class__.__name__)
@@ -55,7 +62,7 @@ class Relation(object):
 
     def __get__(self, instance, owner=None):
         manager = self.get_manager_from_instance(instance)
-        return manager if self.multi else manager.first()
+        return manager if self.multi else manager.get_single()
 
     def __set__(self, instance, values):
         if not self.multi:
@@ -83,16 +90,29 @@ class Relation(object):
 
     # ------------------------------------------------------------------------
 
-    def add_manager_to_instance(self, instance):
+    def create(self):
+        """
+        Create the message attribute of the relation using the state of the
+        class. The attribute matches the attribute that is added by the
+        manager.
+
+        :return: Attribute
+        :rtype: OpenMaya.MObject
+        """
+        return managers.create_attribute(self.name, rev=self.rev, multi=self.multi, hidden=self.hidden)
+
+    def add_manager_to_instance(self, instance, hydrate=False):
         """
         Add a connection attribute to the instance. The connection attribute
         is a maya message attribute, depending on the multi and rev settings
         the connection will be hidden and is determined to only be a source
         or a destination. When a relation is set to be hidden the attribute
         is hidden. The attribute is controlled by a manager. This manager gets
-        stored on the instance and will be returned.
+        stored on the instance and will be returned. When hydrating the
+        attribute is trusted to exist and will not be validated.
 
         :param models.Model instance:
+        :param bool hydrate:
         :return: Manager
         :rtype: managers.Manager
         """
@@ -105,18 +125,21 @@ class Relation(object):
             cls=self.cls,
             typed=self.typed,
             validators=self.validators,
+            cache=self.cache,
         )
 
         # add manager
         name = "_{}".format(self.name)
         setattr(instance, name, manager)
+        getattr(instance, "_managers")[self.name] = manager
 
         # add attribute
-        manager.add_attribute_to_instance(
-            instance,
-            multi=self.multi,
-            hidden=self.hidden,
-        )
+        if not hydrate:
+            manager.add_attribute_to_instance(
+                instance,
+                multi=self.multi,
+                hidden=self.hidden,
+            )
 
         return manager
 
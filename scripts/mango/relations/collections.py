@@ -17,7 +17,8 @@ class Collection(base.Relation):
             persist=True,
             typed=False,
             validators=(),
-            on_delete=CASCADE
+            on_delete=CASCADE,
+            cache=False,
     ):
         """
         Collections allow for a relation to be created on the source model
@@ -37,6 +38,7 @@ class Collection(base.Relation):
             on_delete=on_delete,
             validators=validators,
             multi=multi,
+            cache=cache,
         )
 
         self.rev = True
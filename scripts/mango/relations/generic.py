@@ -21,7 +21,8 @@ class OneToOneRel(base.Relation):
             persist=True,
             typed=False,
             validators=(),
-            on_delete=CASCADE
+            on_delete=CASCADE,
+            cache=False,
     ):
         super(OneToOneRel, self).__init__(
             cls=cls,
@@ -35,6 +36,7 @@ class OneToOneRel(base.Relation):
             on_delete=on_delete,
             validators=validators,
             multi=False,
+            cache=cache,
         )
 
 
@@ -49,7 +51,8 @@ class OneToManyRel(base.Relation):
             persist=True,
             typed=False,
             validators=(),
-            on_delete=CASCADE
+            on_delete=CASCADE,
+            cache=False,
     ):
         super(OneToManyRel, self).__init__(
             cls=cls,
@@ -63,6 +66,7 @@ class OneToManyRel(base.Relation):
             on_delete=on_delete,
             validators=validators,
             multi=True,
+            cache=cache,
         )
 
 
@@ -77,7 +81,8 @@ class ManyToOneRel(base.Relation):
             persist=True,
             typed=False,
             validators=(),
-            on_delete=CASCADE
+            on_delete=CASCADE,
+            cache=False,
     ):
         super(ManyToOneRel, self).__init__(
             cls=cls,
@@ -91,6 +96,7 @@ class ManyToOneRel(base.Relation):
             on_delete=on_delete,
             validators=validators,
             multi=False,
+            cache=cache,
         )
 
 
@@ -105,7 +111,8 @@ class ManyToManyRel(base.Relation):
             persist=True,
             typed=False,
             validators=(),
-            on_delete=CASCADE
+            on_delete=CASCADE,
+            cache=False,
     ):
         super(ManyToManyRel, self).__init__(
             cls=cls,
@@ -119,4 +126,5 @@ class ManyToManyRel(base.Relation):
             on_delete=on_delete,
             validators=validators,
             multi=True,
+            cache=cache,
         )
\ No newline at end of file
@@ -4,40 +4,329 @@ from maya.api import OpenMaya
 
 from mango import models
 from mango.utils import api
+from mango.utils import timing
 
 
 log = logging.getLogger("mango")
 
+DISCOVER_NODES = "nodes"
+DISCOVER_PATTERN = "pattern"
+DISCOVER_ITERATOR = "iterator"
 
-def initialize():
+
+class Discovery(object):
+    """
+    The discovery holds the nodes with a mango attribute that were found in
+    the scene, the strategy that was used to find them and how long it took.
+    """
+    def __init__(self, objects, strategy, duration):
+        self.objects = objects
+        self.strategy = strategy
+        self.duration = duration
+
+    def __repr__(self):
+        return "<{}.{}: {} nodes using '{}' in {:.3f} seconds>".format(
+            self.__class__.__module__,
+            self.__class__.__name__,
+            len(self.objects),
+            self.strategy,
+            self.duration
+        )
+
+    def __len__(self):
+        return len(self.objects)
+
+    def __iter__(self):
+        return iter(self.objects)
+
+
+class NodeTracker(object):
+    """
+    The node tracker collects the nodes that are added to the scene while it
+    is started. This allows for imports and references to only process the
+    nodes they add to the scene. Starting and stopping is done using a key
+    per event, every key keeps a depth which allows for events to be nested,
+    for example a reference that loads other references. The nodes are only
+    returned once every start of every key is stopped. An event of which the
+    stop is never emitted, for example a failed import, keeps the tracker
+    started until it is reset when a new scene is created or opened.
+    """
+    def __init__(self):
+        self._keys = {}
+        self._handles = []
+        self._callback = None
+
+    def __repr__(self):
+        return "<{}.{}: {}>".format(
+            self.__class__.__module__,
+            self.__class__.__name__,
+            "tracking" if self.is_tracking() else "idle"
+        )
+
+    # ------------------------------------------------------------------------
+
+    def _emit_node_added(self, m_object, *args):
+        """
+        :param OpenMaya.MObject m_object:
+        """
+        self._handles.append(OpenMaya.MObjectHandle(m_object))
+
+    # ------------------------------------------------------------------------
+
+    def is_tracking(self):
+        """
+        :return: Tracking state
+        :rtype: bool
+        """
+        return self._callback is not None
+
+    def start(self, key=None):
+        """
+        Start tracking the nodes added to the scene. If the tracker is
+        already started the depth of the key is increased.
+
+        :param str/None key:
+        """
+        self._keys[key] = self._keys.get(key, 0) + 1
+        if self._callback is None:
+            self._handles = []
+            self._callback = OpenMaya.MDGMessage.addNodeAddedCallback(
+                self._emit_node_added,
+                "dependNode"
+            )
+
+    def stop(self, key=None):
+        """
+        Stop tracking the nodes added to the scene. The depth of the key is
+        decreased, once no starts of any key remain the valid nodes that
+        were added are returned. When other starts remain or the key was
+        never started None is returned.
+
+        :param str/None key:
+        :return: Added nodes
+        :rtype: list[OpenMaya.MObject]/None
+        """
+        if key not in self._keys:
+            return None
+
+        depth = self._keys.pop(key) - 1
+        if depth > 0:
+            self._keys[key] = depth
+        if self._keys:
+            return None
+
+        handles = self._handles
+        self.reset()
+        return [handle.object() for handle in handles if handle.isValid()]
+
+    def reset(self):
+        """
+        Stop tracking and clear any added nodes regardless of the started
+        keys.
+        """
+        if self._callback is not None:
+            OpenMaya.MMessage.removeCallback(self._callback)
+
+        self._keys = {}
+        self._handles = []
+        self._callback = None
+
+
+tracker = NodeTracker()
+
+
+def discover_nodes(objects):
+    """
+    Find all nodes with a mango attribute in the provided nodes.
+
+    :param list[OpenMaya.MObject] objects:
+    :return: Nodes
+    :rtype: list[OpenMaya.MObject]
+    """
+    mfn_dependency = OpenMaya.MFnDependencyNode()
+    objects_tagged = []
+
+    for m_object in objects:
+        mfn_dependency.setObject(m_object)
+        if mfn_dependency.hasAttribute("mango"):
+            objects_tagged.append(m_object)
+
+    return objects_tagged
+
+
+def discover_pattern():
+    """
+    Find all nodes with a mango attribute using attribute patterns in a
+    selection list. A pattern is added for every namespace in the scene as
+    wildcards do not match across namespaces.
+
+    :return: Nodes
+    :rtype: list[OpenMaya.MObject]
+    """
+    namespaces = OpenMaya.MNamespace.getNamespaces(":", True)
+    patterns = ["*.mango"] + [
+        "{}:*.mango".format(namespace.lstrip(":"))
+        for namespace in namespaces
+    ]
+
+    selection = OpenMaya.MSelectionList()
+    for pattern in patterns:
+        try:
+            selection.add(pattern)
+        except RuntimeError:
+            # no nodes in the namespace match the pattern
+            continue
+
+    return [selection.getDependNode(i) for i in range(selection.length())]
+
+
+def discover_iterator():
+    """
+    Find all nodes with a mango attribute by iterating all dependency nodes
+    in the scene.
+
+    :return: Nodes
+    :rtype: list[OpenMaya.MObject]
+    """
+    objects = []
+    mfn_dependency = OpenMaya.MFnDependencyNode()
+
+    iterator = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kDependencyNode)
+    while not iterator.isDone():
+        m_object = iterator.thisNode()
+        mfn_dependency.setObject(m_object)
+        if mfn_dependency.hasAttribute("mango"):
+            objects.append(m_object)
+
+        iterator.next()
+
+    return objects
+
+
+def discover(strategy=None, objects=None):
+    """
+    Find all nodes in the scene with a mango attribute. By default the
+    attribute pattern strategy is used, it is possible to force the
+    dependency node iterator instead. When objects are provided only those
+    objects are processed.
+
+    :param str/None strategy:
+    :param list[OpenMaya.MObject]/None objects:
+    :return: Discovery
+    :rtype: Discovery
+    :raise ValueError: When the strategy is not supported.
+    """
+    t = time.time()
+
+    if strategy not in (None, DISCOVER_PATTERN, DISCOVER_ITERATOR):
+        raise ValueError("Discover strategy '{}' is not supported.".format(strategy))
+
+    if objects is not None:
+        objects = discover_nodes(objects)
+        strategy = DISCOVER_NODES
+    elif strategy == DISCOVER_ITERATOR:
+        objects = discover_iterator()
+    else:
+        objects = discover_pattern()
+        strategy = DISCOVER_PATTERN
+
+    discovery = Discovery(objects, strategy, time.time() - t)
+    log.debug("Discovered {} nodes using '{}' in {:.3f} seconds.".format(
+        len(discovery),
+        discovery.strategy,
+        discovery.duration
+    ))
+
+    return discovery
+
+
+def initialize(lazy=False, objects=None):
     """
     The initialization of a current scene find any object with a mango
     attribute and initialize its class. This will place it in memory and
     speed up the loading times. If the initialization of the model fails a
     warning message will be presented to the user.
+
+    When initializing lazily only the node handles and their type tags are
+    stored in the registry. The models are initialized once they are
+    requested from the managers or once the nodes are initialized directly.
+
+    When objects are provided only those objects are initialized, this is
+    used to only process the nodes added by an import or reference.
+
+    The initialization is recorded in a report that holds the duration of
+    the different phases and the number of models per type, the report is
+    logged at debug level.
+
+    :param bool lazy:
+    :param list[OpenMaya.MObject]/None objects:
+    :return: Report
+    :rtype: timing.Report
     """
-    t = time.time()
     initialized = 0
+    registry = models.Model.registry
+    report = timing.Report("Initialize")
 
-    iterator = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kDependencyNode)
-    while not iterator.isDone():
-        m_object = iterator.thisNode()
-        mfn_dependency = OpenMaya.MFnDependencyNode(m_object)
+    with timing.record(report):
+        with report.phase("discovery"):
+            discovery = discover(objects=objects)
 
-        if mfn_dependency.hasAttribute("mango"):
-            try:
-                models.Model(mfn_dependency)
-                initialized += 1
-            except (RuntimeError, ImportError) as e:
-                log.warning("Unable to initialize node '{}'; {}".format(
-                    mfn_dependency.name(),
-                    str(e)
-                ))
+        for m_object in discovery:
+            mfn_dependency = OpenMaya.MFnDependencyNode(m_object)
 
-        iterator.next()
+            if lazy:
+                with report.phase("pending registration"):
+                    handle = OpenMaya.MObjectHandle(m_object)
+                    if registry.get(handle) is None:
+                        type_value = mfn_dependency.findPlug("mango", False).asString()
+                        registry.add_pending(handle, type_value)
+                        initialized += 1
+            else:
+                try:
+                    t = time.time()
+                    model = models.Model(mfn_dependency)
+                    report.add_type(model.type, time.time() - t)
+                    initialized += 1
+                except (RuntimeError, ImportError) as e:
+                    log.warning("Unable to initialize node '{}'; {}".format(
+                        mfn_dependency.name(),
+                        str(e)
+                    ))
 
-    delta = time.time() - t
-    log.info("Initialized {} models in {:.3f} seconds.".format(initialized, delta))
+    log.info("Initialized {} {}models in {:.3f} seconds.".format(
+        initialized,
+        "pending " if lazy else "",
+        report.duration
+    ))
+    report.log()
+
+    return report
+
+
+def track(key=None):
+    """
+    Start tracking the nodes that are added to the scene, this is used
+    before an import or a reference gets created or loaded. The key
+    identifies the event that started the tracking.
+
+    :param str/None key:
+    """
+    tracker.start(key)
+
+
+def initialize_tracked(key=None, lazy=False):
+    """
+    Stop tracking the nodes that are added to the scene and initialize the
+    added nodes. If other keys are still tracking nothing will happen.
+
+    :param str/None key:
+    :param bool lazy:
+    :return: Report
+    :rtype: timing.Report/None
+    """
+    objects = tracker.stop(key)
+    if objects is not None:
+        return initialize(lazy=lazy, objects=objects)
 
 
 def migrate():
@@ -47,7 +336,12 @@ def migrate():
     gets imported when needed. When class' move it is possible for this module
     path to be incorrect. This function will loop over all models initialized
     in the scene and reset the mango attribute and validate its assigned
-    fields and relations.
+    fields and relations. Models of which the stored type and schema match
+    their type are skipped, after migrating a model its schema is updated.
+    The migration is recorded in a report which is logged at debug level.
+
+    :return: Report
+    :rtype: timing.Report
     """
     def migrate_type():
         with api.MDGModifier() as modifier:
@@ -81,68 +375,95 @@ def migrate():
             message
         ))
 
-    t = time.time()
+    report = timing.Report("Migrate")
 
     # migrate models
-    for model in models.Model.objects.all():
-        cls = model.__class__
-
-        # migrate type
-        plug = model.get_plug("mango")
-        old_value = plug.asString()
-        new_value = "{}.{}".format(cls.__module__, cls.__name__)
-        if old_value != new_value:
-            migrate_type()
-
-        # migrate fields
-        for field in cls.fields.values():
-            # validate parent plug
-            plug = model.get_plug(field.name)
-            if plug.isArray is not field.multi:
-                migrate_field("incorrect multi")
-                continue
-            elif plug.isCompound is not bool(field.compound):
-                migrate_field("incorrect compound")
-                continue
-            elif plug.isCompound and plug.numChildren() != len(field.compound or []):
-                migrate_field("incorrect compound number")
-                continue
-
-            # validate component plug
-            plug = plug.child(0) if plug.isCompound else plug
-            attribute = plug.attribute()
-
-            if attribute.apiType() != field.mfn.type():
-                migrate_field("incorrect attribute type")
-                continue
-
-            field.mfn.setObject(attribute)
-            if attribute.hasFn(OpenMaya.MFn.kNumericAttribute) and field.mfn.numericType() is not field.mfn_type:
-                migrate_field("incorrect numeric attribute type")
-                continue
-            elif attribute.hasFn(OpenMaya.MFn.kTypedAttribute) and field.mfn.attrType() is not field.mfn_type:
-                migrate_field("incorrect typed attribute type")
-                continue
-
-            # TODO: update default value
-            # TODO: update hidden
-            # TODO: update keyable
-            # TODO: update channel box
-
-        # migrate relations
-        for relation in cls.relations.values():
-            plug = model.get_plug(relation.name)
-            attribute = plug.attribute()
-            attribute_fn = OpenMaya.MFnAttribute(attribute)
-
-            if plug.isArray is not relation.multi:
-                migrate_relation("incorrect multi")
-                continue
-            elif attribute_fn.writable is not relation.rev:
-                migrate_relation("incorrect direction")
-                continue
-
-            # TODO: update hidden
-
-    delta = time.time() - t
-    log.info("Migrated models in {:.3f} seconds.".format(delta))
+    with timing.record(report):
+        for model in models.Model.objects_typed.all():
+            t = time.time()
+            cls = model.__class__
+
+            # validate schema, models of which the type and schema match
+            # are current and can be skipped.
+            with report.phase("schema validation"):
+                plug = model.get_plug("mango")
+                old_value = plug.asString()
+                new_value = "{}.{}".format(cls.__module__, cls.__name__)
+                if old_value == new_value and model.get_schema() == cls.schema:
+                    continue
+
+            # migrate type
+            with report.phase("type validation"):
+                if old_value != new_value:
+                    migrate_type()
+
+            # migrate fields
+            with report.phase("field validation"):
+                for field in cls.fields.values():
+                    # validate attribute, as existing nodes are hydrated
+                    # without validating its attributes they could be missing.
+                    if not model.has_attribute(field.name):
+                        migrate_field("missing attribute")
+                        continue
+
+                    # validate parent plug
+                    plug = model.get_plug(field.name)
+                    if plug.isArray is not field.array:
+                        migrate_field("incorrect multi")
+                        continue
+                    elif plug.isCompound is not bool(field.compound):
+                        migrate_field("incorrect compound")
+                        continue
+                    elif plug.isCompound and plug.numChildren() != len(field.compound or []):
+                        migrate_field("incorrect compound number")
+                        continue
+
+                    # validate component plug
+                    plug = plug.child(0) if plug.isCompound else plug
+                    attribute = plug.attribute()
+
+                    if attribute.apiType() != field.mfn.type():
+                        migrate_field("incorrect attribute type")
+                        continue
+
+                    field.mfn.setObject(attribute)
+                    if attribute.hasFn(OpenMaya.MFn.kNumericAttribute) and field.mfn.numericType() is not field.mfn_type:
+                        migrate_field("incorrect numeric attribute type")
+                        continue
+                    elif attribute.hasFn(OpenMaya.MFn.kTypedAttribute) and field.mfn.attrType() is not field.mfn_type:
+                        migrate_field("incorrect typed attribute type")
+                        continue
+
+                    # TODO: update default value
+                    # TODO: update hidden
+                    # TODO: update keyable
+                    # TODO: update channel box
+
+            # migrate relations
+            with report.phase("relation validation"):
+                for relation in cls.relations.values():
+                    if not model.has_attribute(relation.name):
+                        migrate_relation("missing attribute")
+                        continue
+
+                    plug = model.get_plug(relation.name)
+                    attribute = plug.attribute()
+                    attribute_fn = OpenMaya.MFnAttribute(attribute)
+
+                    if plug.isArray is not relation.multi:
+                        migrate_relation("incorrect multi")
+                        continue
+                    elif attribute_fn.writable is not relation.rev:
+                        migrate_relation("incorrect direction")
+                        continue
+
+                    # TODO: update hidden
+
+            # migrate schema
+            model.set_schema()
+            report.add_type(model.type, time.time() - t)
+
+    log.info("Migrated models in {:.3f} seconds.".format(report.duration))
+    report.log()
+
+    return report
@@ -0,0 +1,61 @@
+import heapq
+
+
+__all__ = [
+    "IndexAllocator",
+]
+
+
+class IndexAllocator(object):
+    """
+    The index allocator keeps track of the free logical indices of an array
+    plug. It is seeded once using the existing indices of the plug, after
+    which any holes are handed out first before the index after the highest
+    index is used.
+    """
+    def __init__(self):
+        self._holes = []
+        self._next = None
+
+    def __repr__(self):
+        return "<{}.{}: {}>".format(
+            self.__class__.__module__,
+            self.__class__.__name__,
+            "next={}, holes={}".format(self._next, len(self._holes)) if self.is_seeded() else "unseeded"
+        )
+
+    # ------------------------------------------------------------------------
+
+    def is_seeded(self):
+        """
+        :return: Seeded state
+        :rtype: bool
+        """
+        return self._next is not None
+
+    def seed(self, indices):
+        """
+        :param iterable indices:
+        """
+        used = set(indices)
+        self._next = max(used) + 1 if used else 0
+        self._holes = [index for index in range(self._next) if index not in used]
+        heapq.heapify(self._holes)
+
+    # ------------------------------------------------------------------------
+
+    def allocate(self):
+        """
+        :return: Free index
+        :rtype: int
+        :raise RuntimeError: When the allocator is not seeded.
+        """
+        if not self.is_seeded():
+            raise RuntimeError("Unable to allocate index, allocator is not seeded.")
+
+        if self._holes:
+            return heapq.heappop(self._holes)
+
+        index = self._next
+        self._next += 1
+        return index
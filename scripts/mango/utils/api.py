@@ -5,15 +5,84 @@ from mango.utils import naming
 from mango.vendor import apiundo
 
 
+_chunks = []
+
+
 def execute_modifier(modifier):
     """
     Execute a modifier object. After this the apiundo package is used to
-    ensure that the command is undo/redo-able within Maya.
+    ensure that the command is undo/redo-able within Maya. When an undo
+    chunk is open the modifier is added to the chunk instead.
 
     :param OpenMaya.MDGModifier/OpenMaya.MDagModifier modifier:
     """
     modifier.doIt()
-    apiundo.commit(undo=modifier.undoIt, redo=modifier.doIt)
+
+    if _chunks:
+        _chunks[-1].append(modifier)
+    else:
+        apiundo.commit(undo=modifier.undoIt, redo=modifier.doIt)
+
+
+class UndoChunk(object):
+    """
+    The undo chunk collects all modifiers executed within its context and
+    commits them as a single undo entry once the context is exited. Nested
+    chunks are merged into the outer chunk. The outermost chunk also opens
+    a Maya undo chunk, this makes sure any commands executed within the
+    context, like the creation of namespaces, are part of the same undo
+    entry.
+
+    When an exception is raised within the context the modifiers of the
+    chunk are undone and nothing is committed.
+    """
+    def __init__(self):
+        self._modifiers = []
+
+    def __enter__(self):
+        if not _chunks:
+            cmds.undoInfo(openChunk=True)
+
+        _chunks.append(self._modifiers)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if not _chunks or _chunks[-1] is not self._modifiers:
+            raise RuntimeError("Unable to exit undo chunk, it is not the innermost open chunk.")
+
+        _chunks.pop()
+
+        try:
+            self._commit(exc_type is not None)
+        finally:
+            if not _chunks:
+                cmds.undoInfo(closeChunk=True)
+
+    def _commit(self, rollback):
+        """
+        :param bool rollback:
+        """
+        modifiers = self._modifiers
+        if not modifiers:
+            return
+        elif rollback:
+            for modifier in reversed(modifiers):
+                modifier.undoIt()
+
+            return
+        elif _chunks:
+            _chunks[-1].extend(modifiers)
+            return
+
+        def undo():
+            for modifier in reversed(modifiers):
+                modifier.undoIt()
+
+        def redo():
+            for modifier in modifiers:
+                modifier.doIt()
+
+        apiundo.commit(undo=undo, redo=redo)
 
 
 class MDGModifier(object):
@@ -60,6 +129,52 @@ def get_plug(node):
     return sel.getPlug(0)
 
 
+def find_plug(mfn_dependency, attribute):
+    """
+    Find a plug using the dependency node function set and the attribute
+    object. This avoids the construction of a node path and the parsing of
+    the path by a selection list.
+
+    :param OpenMaya.MFnDependencyNode mfn_dependency:
+    :param OpenMaya.MObject attribute:
+    :return: Maya plug
+    :rtype: OpenMaya.MPlug
+    :raise RuntimeError: When the attribute is invalid.
+    """
+    if attribute.isNull():
+        raise RuntimeError("Unable to find plug using a null attribute.")
+
+    return mfn_dependency.findPlug(attribute, False)
+
+
+def get_plug_child(plug, index):
+    """
+    :param OpenMaya.MPlug plug:
+    :param int index:
+    :return: Maya child plug
+    :rtype: OpenMaya.MPlug
+    :raise RuntimeError: When the plug is not a compound.
+    """
+    if not plug.isCompound:
+        raise RuntimeError("Plug '{}' is not a compound.".format(plug.name()))
+
+    return plug.child(index)
+
+
+def get_plug_element(plug, index):
+    """
+    :param OpenMaya.MPlug plug:
+    :param int index:
+    :return: Maya element plug
+    :rtype: OpenMaya.MPlug
+    :raise RuntimeError: When the plug is not an array.
+    """
+    if not plug.isArray:
+        raise RuntimeError("Plug '{}' is not an array.".format(plug.name()))
+
+    return plug.elementByLogicalIndex(index)
+
+
 def create_node(node_type, name=None, parent=None):
     """
     :param str node_type:
@@ -68,31 +183,55 @@ def create_node(node_type, name=None, parent=None):
     :return: Node
     :rtype: OpenMaya.MObject
     """
-    # convert parent
-    if not parent:
-        parent = OpenMaya.MObject.kNullObj
-    elif not isinstance(parent, OpenMaya.MObject):
-        parent = get_object(parent)
+    return create_nodes(node_type, [name], [parent])[0]
 
-    # create node
+
+def create_nodes(node_type, names, parents=None):
+    """
+    Create multiple nodes of the same type using a single modifier. The
+    namespaces of the names are only validated once.
+
+    :param str node_type:
+    :param list[str/None] names:
+    :param list[str/OpenMaya.MObject/None]/None parents:
+    :return: Nodes
+    :rtype: list[OpenMaya.MObject]
+    """
+    def get_parent(parent_):
+        """
+        :param str/OpenMaya.MObject/None parent_:
+        :return: Parent
+        :rtype: OpenMaya.MObject
+        """
+        if not parent_:
+            return OpenMaya.MObject.kNullObj
+        elif not isinstance(parent_, OpenMaya.MObject):
+            return get_object(parent_)
+
+        return parent_
+
+    parents = parents or [None] * len(names)
+
+    # create nodes
     try:
         rename_children = True
         modifier = OpenMaya.MDagModifier()
-        m_object = modifier.createNode(node_type, parent)
+        m_objects = [modifier.createNode(node_type, get_parent(parent)) for parent in parents]
     except TypeError:
         rename_children = False
         modifier = OpenMaya.MDGModifier()
-        m_object = modifier.createNode(node_type)
+        m_objects = [modifier.createNode(node_type) for _ in parents]
 
-    # create namespace
-    namespace = naming.get_namespace(name)
-    if namespace:
+    # create namespaces
+    namespaces = {naming.get_namespace(name) for name in names if name}
+    for namespace in sorted(namespace for namespace in namespaces if namespace):
         if not cmds.namespace(exists=namespace):
             cmds.namespace(add=namespace)
 
-    # rename node
-    if name:
-        modifier.renameNode(m_object, name)
+    # rename nodes
+    for m_object, name in zip(m_objects, names):
+        if name:
+            modifier.renameNode(m_object, name)
 
     # execute modifier, this needs to happen now as other wise no shape nodes
     # exist and the shapes will not be renamed. The renaming of the shapes
@@ -100,13 +239,17 @@ def create_node(node_type, name=None, parent=None):
     execute_modifier(modifier)
 
     # rename node shapes
-    if name and rename_children:
+    if rename_children and any(names):
         with MDGModifier() as modifier:
-            m_dag_path = OpenMaya.MDagPath.getAPathTo(m_object)
-            for index in range(m_dag_path.childCount()):
-                modifier.renameNode(
-                    m_dag_path.child(index),
-                    "{}Shape#".format(name)
-                )
-
-    return m_object
+            for m_object, name in zip(m_objects, names):
+                if not name:
+                    continue
+
+                m_dag_path = OpenMaya.MDagPath.getAPathTo(m_object)
+                for index in range(m_dag_path.childCount()):
+                    modifier.renameNode(
+                        m_dag_path.child(index),
+                        "{}Shape#".format(name)
+                    )
+
+    return m_objects
@@ -0,0 +1,178 @@
+import time
+import logging
+from collections import OrderedDict
+
+
+__all__ = [
+    "Report",
+    "record",
+    "phase",
+]
+
+
+log = logging.getLogger("mango")
+_reports = []
+
+
+class Phase(object):
+    """
+    The phase is a context manager that adds the time spent within its
+    context to the provided phase of the report.
+    """
+    def __init__(self, report, name):
+        self.report = report
+        self.name = name
+        self._t = None
+
+    def __enter__(self):
+        self._t = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.report.add_phase(self.name, time.time() - self._t)
+
+
+class PhaseNull(object):
+    """
+    The null phase is a context manager that does nothing, it is returned
+    when no report is being recorded to keep the overhead to a minimum.
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+PHASE_NULL = PhaseNull()
+
+
+class Report(object):
+    """
+    The report stores the duration of the different phases of a process and
+    the number of models processed per type including the time it took to
+    process them. The durations of phases are accumulated, this means that
+    a phase can be entered multiple times.
+    """
+    def __init__(self, name):
+        self.name = name
+        self.duration = 0.0
+        self.phases = OrderedDict()
+        self.types = {}
+
+    def __repr__(self):
+        return "<{}.{}: {} in {:.3f} seconds>".format(
+            self.__class__.__module__,
+            self.__class__.__name__,
+            self.name,
+            self.duration
+        )
+
+    def __str__(self):
+        lines = ["{} in {:.3f} seconds.".format(self.name, self.duration)]
+        for name, duration in self.phases.items():
+            lines.append("  {:<24} {:>10.3f} s".format(name, duration))
+
+        slowest = self.slowest()
+        if slowest:
+            lines.append("Slowest types:")
+            for name, count, duration in slowest:
+                lines.append("  {:<24} {:>10.3f} s {:>8} models".format(name, duration, count))
+
+        return "\n".join(lines)
+
+    # ------------------------------------------------------------------------
+
+    def phase(self, name):
+        """
+        :param str name:
+        :return: Phase context
+        :rtype: Phase
+        """
+        return Phase(self, name)
+
+    def add_phase(self, name, duration):
+        """
+        :param str name:
+        :param float duration:
+        """
+        self.phases[name] = self.phases.get(name, 0.0) + duration
+
+    def add_type(self, name, duration):
+        """
+        :param str name:
+        :param float duration:
+        """
+        count, total = self.types.get(name, (0, 0.0))
+        self.types[name] = (count + 1, total + duration)
+
+    # ------------------------------------------------------------------------
+
+    @property
+    def counts(self):
+        """
+        :return: Number of processed models per type
+        :rtype: dict
+        """
+        return {name: count for name, (count, _) in self.types.items()}
+
+    def slowest(self, number=5):
+        """
+        :param int number:
+        :return: Slowest types with their count and duration
+        :rtype: list[tuple[str, int, float]]
+        """
+        types = [(name, count, duration) for name, (count, duration) in self.types.items()]
+        types.sort(key=lambda t: t[2], reverse=True)
+        return types[:number]
+
+    def log(self, level=logging.DEBUG):
+        """
+        :param int level:
+        """
+        if log.isEnabledFor(level):
+            log.log(level, str(self))
+
+
+class Record(object):
+    """
+    The record context manager makes the provided report active, any phases
+    entered within the context are added to the report. The total duration
+    of the context is stored on the report.
+    """
+    def __init__(self, report):
+        self.report = report
+        self._t = None
+
+    def __enter__(self):
+        self._t = time.time()
+        _reports.append(self.report)
+        return self.report
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _reports.remove(self.report)
+        self.report.duration += time.time() - self._t
+
+
+def record(report):
+    """
+    :param Report report:
+    :return: Record context
+    :rtype: Record
+    """
+    return Record(report)
+
+
+def phase(name):
+    """
+    Get a phase context of the active report, if no report is active a
+    null context is returned.
+
+    :param str name:
+    :return: Phase context
+    :rtype: Phase/PhaseNull
+    """
+    if not _reports:
+        return PHASE_NULL
+
+    return _reports[-1].phase(name)
@@ -12,18 +12,58 @@ def initialize(*args, **kwargs):
     import statement is done in the function itself.
     """
     from mango import scene
+    scene.tracker.reset()
     scene.initialize()
 
 
+def reset(*args, **kwargs):
+    """
+    The reset function stops any tracking of nodes, this makes sure that
+    tracking that was never stopped by a failed import or reference doesn't
+    continue in a new scene.
+    """
+    from mango import scene
+    scene.tracker.reset()
+
+
+def track(key):
+    """
+    The track function is a wrapper to the track function in the mango. It
+    will start tracking the nodes that are added to the scene.
+
+    :param str key:
+    """
+    from mango import scene
+    scene.track(key)
+
+
+def initialize_tracked(key):
+    """
+    The initialize tracked function is a wrapper to the initialize tracked
+    function in the mango. It will only initialize the nodes that were added
+    to the scene since tracking started.
+
+    :param str key:
+    """
+    from mango import scene
+    scene.initialize_tracked(key)
+
+
 def register_scene_callbacks():
     """
     Register a scene callbacks that process the current scene when triggered.
-    The current scene will be read and all mango models initialized.
+    When opening a scene all mango models are initialized, when importing or
+    creating/loading a reference only the added nodes are initialized.
     """
-    OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kAfterImport, initialize)
+    OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeNew, reset)
+    OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeOpen, reset)
     OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kAfterOpen, initialize)
-    OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kAfterCreateReference, initialize)
-    OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kAfterLoadReference, initialize)
+    OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeImport, track, "import")
+    OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kAfterImport, initialize_tracked, "import")
+    OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeCreateReference, track, "reference")
+    OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kAfterCreateReference, initialize_tracked, "reference")
+    OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeLoadReference, track, "reference")
+    OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kAfterLoadReference, initialize_tracked, "reference")
     log.info("Scene callbacks registered.")
 
 
@@ -0,0 +1,110 @@
+from maya import cmds
+from mayaunittest import MayaTestCase
+
+from mango import fields
+from mango.models import Model
+
+
+class TestIndexes(MayaTestCase):
+    def test_create(self):
+        with self.assertRaises(TypeError):
+            fields.MatrixField(index=True)
+        with self.assertRaises(TypeError):
+            fields.Float3Field(index=True)
+
+        fields.IntegerField(index=True, keyable=True)
+
+    def test_lookup(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0, index=True)
+            side = fields.StringField(default_value="C", index=True)
+
+        nodes = [TestModel(name="test_{}".format(i), value=i, side="L" if i % 2 else "R") for i in range(5)]
+
+        manager = TestModel.objects
+        self.assertEqual(manager.lookup_index("side", "L"), [nodes[1], nodes[3]])
+        self.assertEqual(set(manager.lookup_index("value__ge", 3)), {nodes[3], nodes[4]})
+        self.assertEqual(set(manager.lookup_index("value__in", [0, 4, 7])), {nodes[0], nodes[4]})
+        self.assertIsNone(manager.lookup_index("side__contains", "L"))
+        self.assertIsNone(manager.lookup_index("name", "test_0"))
+
+    def test_update(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0, index=True)
+
+        nodes = [TestModel(name="test_{}".format(i), value=i) for i in range(2)]
+
+        nodes[0].value = 10
+        self.assertEqual(TestModel.objects.lookup_index("value", 10), [nodes[0]])
+
+        cmds.setAttr("{}.value".format(nodes[1].path), 20)
+        self.assertEqual(TestModel.objects.lookup_index("value", 20), [nodes[1]])
+        self.assertEqual(TestModel.objects.lookup_index("value", 1), [])
+        self.assertEqual(list(TestModel.objects.filter(value=20)), [nodes[1]])
+
+    def test_driven(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0, index=True, keyable=True)
+
+        nodes = [TestModel(name="test_{}".format(i), value=i) for i in range(2)]
+        driver = cmds.createNode("network", name="driver")
+        cmds.addAttr(driver, longName="value", attributeType="long")
+
+        cmds.connectAttr("driver.value", "{}.value".format(nodes[1].path))
+        self.assertIn(nodes[1], TestModel.objects.lookup_index("value", 5))
+
+        cmds.setAttr("driver.value", 5)
+        self.assertEqual(list(TestModel.objects.filter(value=5)), [nodes[1]])
+
+        cmds.disconnectAttr("driver.value", "{}.value".format(nodes[1].path))
+        cmds.setAttr("{}.value".format(nodes[1].path), 7)
+        self.assertEqual(TestModel.objects.lookup_index("value", 5), [])
+        self.assertEqual(TestModel.objects.lookup_index("value", 7), [nodes[1]])
+
+    def test_undo(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0, index=True)
+
+        node = TestModel(name="test", value=0)
+
+        node.value = 10
+        cmds.undo()
+        self.assertEqual(TestModel.objects.lookup_index("value", 0), [node])
+        self.assertEqual(TestModel.objects.lookup_index("value", 10), [])
+
+    def test_untracked(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0, index=True)
+
+        node = TestModel(name="test", value=0)
+
+        Model.registry.delete_callbacks()
+        cmds.setAttr("{}.value".format(node.path), 3)
+        self.assertIsNone(TestModel.objects.lookup_index("value", 3))
+        self.assertEqual(list(TestModel.objects.filter(value=3)), [node])
+
+        Model.registry.register_index_callbacks()
+        self.assertEqual(TestModel.objects.lookup_index("value", 3), [node])
+
+    def test_delete(self):
+        class TestModel(Model):
+            side = fields.StringField(default_value="C", index=True)
+
+        nodes = [TestModel(name="test_{}".format(i), side="L") for i in range(2)]
+
+        nodes[0].delete()
+        self.assertEqual(TestModel.objects.lookup_index("side", "L"), [nodes[1]])
+
+    def test_filter(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0, index=True)
+            side = fields.StringField(default_value="C", index=True)
+
+        nodes = [TestModel(name="test_{}".format(i), value=i, side="L" if i % 2 else "R") for i in range(5)]
+
+        queryset = TestModel.objects.filter(side="L", value__gt=1)
+        self.assertEqual(list(queryset), [nodes[3]])
+        self.assertEqual(TestModel.objects.exclude(side="L").count(), 3)
+
+        cmds.setAttr("{}.side".format(nodes[0].path), "L", type="string")
+        self.assertEqual(list(TestModel.objects.filter(side="L", value__lt=1)), [nodes[0]])
@@ -0,0 +1,51 @@
+from mayaunittest import MayaTestCase
+
+from mango import fields
+from mango import lookups
+from mango.models import Model
+
+
+class TestLookups(MayaTestCase):
+    def test_lookups(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+            label = fields.StringField()
+
+        for i in range(5):
+            TestModel(name="test_{}".format(i), value=i, label="Arm_{}".format(i))
+
+        manager = TestModel.objects
+        self.assertEqual(manager.filter(value__in=[1, 3]).count(), 2)
+        self.assertEqual(manager.filter(value__range=(1, 3)).count(), 3)
+        self.assertEqual(manager.filter(label__startswith="Arm").count(), 5)
+        self.assertEqual(manager.filter(label__icontains="ARM_4").count(), 1)
+        self.assertEqual(manager.filter(label__isnull=True).count(), 0)
+        self.assertEqual(manager.filter(name__endswith="_2").count(), 1)
+
+        with self.assertRaises(RuntimeError):
+            manager.filter(value__unknown=1)
+
+    def test_register_lookup(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+
+        for i in range(5):
+            TestModel(name="test_{}".format(i), value=i)
+
+        @lookups.register_lookup("odd")
+        def odd(a, b):
+            return (a % 2 == 1) is b
+
+        self.assertEqual(TestModel.objects.filter(value__odd=True).count(), 2)
+
+    def test_plan_cache(self):
+        self.assertIs(lookups.get_plan(["value", "label__contains"]), lookups.get_plan(["label__contains", "value"]))
+
+    def test_accessor(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+
+        node = TestModel(name="test_2", value=2)
+        self.assertEqual(lookups.get_accessor(TestModel, "value")(node), 2)
+        self.assertEqual(lookups.get_accessor(TestModel, "name")(node), "test_2")
+        self.assertTrue(lookups.get_accessor(TestModel, "exists")(node))
@@ -4,6 +4,8 @@ from mayaunittest import MayaTestCase
 from mango import fields
 from mango import relations
 from mango.models import Model
+from mango.utils import api
+from mango.utils import timing
 
 
 class TestManagers(MayaTestCase):
@@ -95,6 +97,125 @@ class TestManagers(MayaTestCase):
         self.assertEqual(node_1.link.length(), 1)
         self.assertEqual(node_1.link.first(), node_2)
 
+    def test_bulk_create(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+            link = relations.OneToManyRel(rev_name="link_rev")
+
+        node = TestModel(name="test")
+        nodes = TestModel.objects.bulk_create([
+            {"name": "ns:test_{}".format(i), "value": i, "link_rev": node}
+            for i in range(5)
+        ])
+        self.assertEqual(len(nodes), 5)
+        self.assertEqual(nodes[2].name, "ns:test_2")
+        self.assertEqual(nodes[2].value, 2)
+        self.assertEqual(node.link.length(), 5)
+        self.assertEqual(TestModel.objects.count(), 6)
+
+        cmds.undo()
+        self.assertFalse(cmds.objExists("ns:test_0"))
+        self.assertFalse(cmds.namespace(exists="ns"))
+
+        with self.assertRaises(TypeError):
+            TestModel.objects.bulk_create([{"unknown": 1}])
+
+        with self.assertRaises(TypeError):
+            TestModel.objects.bulk_create([
+                {"name": "test_{}".format(i), "link_rev": Model(name="other")}
+                for i in range(2)
+            ])
+
+        self.assertFalse(cmds.objExists("test_0"))
+        self.assertEqual(TestModel.objects.count(), 1)
+
+    def test_bulk_create_parent(self):
+        class TestTransform(Model):
+            node_type = "transform"
+
+        parent = TestTransform(name="parent")
+        kwargs_list = [{"name": "child_{}".format(i), "parent": parent} for i in range(2)]
+        nodes = TestTransform.objects.bulk_create(kwargs_list)
+        self.assertEqual(cmds.listRelatives("child_0", parent=True), ["parent"])
+        self.assertEqual(len(nodes), 2)
+
+        TestTransform.objects.bulk_create(kwargs_list)
+        self.assertEqual(len(cmds.listRelatives("parent", children=True)), 4)
+        self.assertEqual(kwargs_list[0], {"name": "child_0", "parent": parent})
+
+    def test_bulk_create_relations(self):
+        class TestModel(Model):
+            link = relations.OneToManyRel(rev_name="link_rev")
+            single = relations.OneToOneRel(rev_name="single_rev")
+
+        node = TestModel(name="test")
+        report = timing.Report("Bulk create")
+        with timing.record(report):
+            nodes = TestModel.objects.bulk_create([
+                {"name": "test_{}".format(i), "link_rev": node, "single_rev": node}
+                for i in range(3)
+            ])
+
+        self.assertIn("relation assignment", report.phases)
+        self.assertIn("attribute assignment", report.phases)
+        self.assertEqual(set(node.link.all()), set(nodes))
+        self.assertEqual(cmds.getAttr("test.link", multiIndices=True), [0, 1, 2])
+        self.assertEqual(node.single, nodes[-1])
+        self.assertIsNone(nodes[0].single_rev)
+
+        cmds.undo()
+        self.assertEqual(node.link.length(), 0)
+        self.assertIsNone(node.single)
+
+    def test_undo_chunk(self):
+        with api.UndoChunk():
+            with api.UndoChunk():
+                pass
+
+            Model(name="test_1")
+
+        self.assertTrue(cmds.objExists("test_1"))
+        cmds.undo()
+        self.assertFalse(cmds.objExists("test_1"))
+
+        with self.assertRaises(RuntimeError):
+            with api.UndoChunk():
+                Model(name="test_2")
+                raise RuntimeError("rollback")
+
+        self.assertFalse(cmds.objExists("test_2"))
+
+    def test_bulk_update(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+
+        nodes = [TestModel(name="test_{}".format(i)) for i in range(5)]
+        TestModel.objects.bulk_update(nodes, value=[4, 3, 2, 1, 0])
+        self.assertEqual([node.value for node in nodes], [4, 3, 2, 1, 0])
+
+        TestModel.objects.bulk_update(nodes, value=7)
+        self.assertEqual([node.value for node in nodes], [7] * 5)
+
+        cmds.undo()
+        self.assertEqual([node.value for node in nodes], [4, 3, 2, 1, 0])
+
+        with self.assertRaises(ValueError):
+            TestModel.objects.bulk_update(nodes, value=[1, 2])
+
+    def test_bulk_update_compound(self):
+        class TestModel(Model):
+            position = fields.Float3Field()
+
+        nodes = [TestModel(name="test_{}".format(i)) for i in range(3)]
+        TestModel.objects.bulk_update(nodes, position=(0.0, 1.0, 0.0))
+        self.assertEqual([tuple(node.position) for node in nodes], [(0.0, 1.0, 0.0)] * 3)
+
+        TestModel.objects.bulk_update(nodes[:2], position={nodes[0]: (1.0, 0.0, 0.0), nodes[1]: (2.0, 0.0, 0.0)})
+        self.assertEqual(tuple(nodes[1].position), (2.0, 0.0, 0.0))
+
+        with self.assertRaises(ValueError):
+            TestModel.objects.bulk_update(nodes, position={nodes[0]: (1.0, 0.0, 0.0)})
+
     def test_add(self):
         class TestModel(Model):
             link = relations.OneToManyRel(rev_name="link_rev")
@@ -104,6 +225,54 @@ class TestManagers(MayaTestCase):
         node_1.link.add(node_2)
         self.assertEqual(node_1.link.length(), 1)
 
+    def test_add_batch(self):
+        class TestModel(Model):
+            link = relations.OneToManyRel(rev_name="link_rev")
+            single = relations.OneToOneRel(rev_name="single_rev")
+
+        node = TestModel(name="test")
+        nodes = [TestModel(name="test_{}".format(i)) for i in range(5)]
+        added = node.link.add(*(nodes + nodes[:2]))
+        self.assertEqual(len(added), 5)
+        self.assertEqual(node.link.length(), 5)
+        self.assertEqual(node.link.add(nodes[0]), ())
+
+        cmds.undo()
+        self.assertEqual(node.link.length(), 0)
+
+        added = node.single.add(*nodes)
+        self.assertEqual(added, (nodes[-1],))
+        self.assertEqual(node.single, nodes[-1])
+
+    def test_add_indices(self):
+        class TestModel(Model):
+            link = relations.OneToManyRel(rev_name="link_rev")
+
+        node = TestModel(name="test")
+        nodes = [TestModel(name="test_{}".format(i)) for i in range(5)]
+        node.link.add(*nodes)
+        node.link.remove(nodes[1], nodes[3])
+        self.assertEqual(cmds.getAttr("test.link", multiIndices=True), [0, 2, 4])
+
+        node.link.add(nodes[1])
+        self.assertEqual(cmds.getAttr("test.link", multiIndices=True), [0, 1, 2, 4])
+
+        cmds.connectAttr("test.link[3]", "test_3.link_rev")
+        node.link.add(TestModel(name="test_5"))
+        self.assertEqual(cmds.getAttr("test.link", multiIndices=True), [0, 1, 2, 3, 4, 5])
+
+    def test_compact(self):
+        class TestModel(Model):
+            link = relations.OneToManyRel(rev_name="link_rev")
+
+        node = TestModel(name="test")
+        nodes = [TestModel(name="test_{}".format(i)) for i in range(5)]
+        node.link.add(*nodes)
+        node.link.remove(nodes[0], nodes[2])
+        self.assertEqual(node.link.compact(), 3)
+        self.assertEqual(cmds.getAttr("test.link", multiIndices=True), [0, 1, 2])
+        self.assertEqual(set(node.link.all()), {nodes[1], nodes[3], nodes[4]})
+
     def test_set(self):
         class TestModel(Model):
             link = relations.OneToManyRel(rev_name="link_rev")
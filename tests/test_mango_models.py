@@ -2,7 +2,9 @@ from maya import cmds
 from maya.api import OpenMaya
 from mayaunittest import MayaTestCase
 
+from mango import fields
 from mango.models import Model
+from mango.utils import api
 
 
 class TestModels(MayaTestCase):
@@ -123,3 +125,105 @@ class TestModels(MayaTestCase):
 
         with self.assertRaises(RuntimeError):
             node.get_plug("test")
+
+    def test_get_plug_cache(self):
+        node = Model(name="test")
+        plug = node.get_plug("message")
+        self.assertEqual(node.get_plug("message"), plug)
+        self.assertEqual(node.cache_info().hits, 1)
+        self.assertEqual(node.cache_info().misses, 1)
+        self.assertEqual(node.cache_info().plugs, 1)
+
+        node.pop_cache("message")
+        self.assertEqual(node.cache_info().plugs, 0)
+
+        attribute = OpenMaya.MFnMessageAttribute().create("test", "test")
+        node.add_attribute(attribute)
+        self.assertIsInstance(node.get_plug("test"), OpenMaya.MPlug)
+
+    def test_get_plug_child(self):
+        cmds.createNode("transform", name="test")
+        node = Model("test")
+        plug = node.get_plug_child("translate", 0)
+        self.assertEqual(plug.partialName(useLongNames=True), "translateX")
+
+        with self.assertRaises(RuntimeError):
+            node.get_plug_child("visibility", 0)
+
+    def test_get_plug_element(self):
+        cmds.createNode("transform", name="test")
+        node = Model("test")
+        plug = node.get_plug_element("worldMatrix", 0)
+        self.assertTrue(plug.isElement)
+        self.assertEqual(plug.logicalIndex(), 0)
+
+        with self.assertRaises(RuntimeError):
+            node.get_plug_element("visibility", 0)
+
+    def test_schema(self):
+        class TestModel(Model):
+            value = fields.IntegerField()
+
+        class TestModelChanged(Model):
+            value = fields.FloatField()
+
+        self.assertNotEqual(TestModel.schema, TestModelChanged.schema)
+
+        node = TestModel(name="test")
+        self.assertEqual(node.get_schema(), TestModel.schema)
+
+        # hydrated nodes are trusted to have their attributes
+        cmds.deleteAttr("test.value")
+        Model.registry.clear()
+        node = TestModel("test")
+        self.assertFalse(node.has_attribute("value"))
+
+    def test_schema_failed(self):
+        class TestModel(Model):
+            value = fields.IntegerField(choices=[1, 2])
+            other = fields.IntegerField()
+
+        with self.assertRaises(ValueError):
+            TestModel(name="test", value=3)
+
+        self.assertFalse(cmds.attributeQuery("mango_schema", node="test", exists=True))
+
+        node = TestModel("test")
+        self.assertTrue(node.has_attribute("value"))
+        self.assertTrue(node.has_attribute("other"))
+
+    def test_update(self):
+        class TestModel(Model):
+            value = fields.IntegerField(min_value=0)
+            position = fields.Float3Field()
+
+        node = TestModel(name="test")
+        node.update(value=5, position=(1.0, 2.0, 3.0))
+        self.assertEqual(node.value, 5)
+        self.assertEqual(node.position, (1.0, 2.0, 3.0))
+
+        with self.assertRaises(ValueError):
+            node.update(value=10, position=(1.0, 2.0))
+        self.assertEqual(node.value, 5)
+
+        with self.assertRaises(TypeError):
+            node.update(unknown=1)
+
+    def test_hash(self):
+        node_1 = Model(name="test_1")
+        node_2 = Model(name="test_2")
+        self.assertEqual(hash(node_1), node_1.hash_code)
+        self.assertEqual(len({node_1, node_2, Model("test_1")}), 2)
+
+        node_1.delete()
+        self.assertIn(node_1, {node_1, node_2})
+        self.assertNotEqual(node_1, node_2)
+
+    def test_resolve(self):
+        node = Model(name="test")
+        self.assertIs(Model.resolve(node.object), node)
+
+        cmds.createNode("transform", name="test_1")
+        node_1 = Model.resolve(api.get_object("test_1"))
+        self.assertIsInstance(node_1, Model)
+        self.assertIs(Model.resolve(node_1.object), node_1)
@@ -0,0 +1,169 @@
+from mayaunittest import MayaTestCase
+
+from mango import fields
+from mango import query
+from mango.models import Model
+
+
+class TestQuerySet(MayaTestCase):
+    def test_lazy(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+
+        for i in range(3):
+            TestModel(name="test_{}".format(i), value=i)
+
+        queryset = TestModel.objects.filter(value__ge=1)
+        self.assertIsInstance(queryset, query.QuerySet)
+
+        TestModel(name="test_3", value=3)
+        self.assertEqual(len(queryset), 3)
+
+        TestModel(name="test_4", value=4)
+        self.assertEqual(len(queryset), 3)
+        self.assertEqual(len(queryset.all()), 4)
+
+    def test_chain(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+
+        for i in range(5):
+            TestModel(name="test_{}".format(i), value=i)
+
+        queryset = TestModel.objects.filter(value__ge=1).exclude(value=3).order_by("-value")
+        self.assertEqual([node.value for node in queryset], [4, 2, 1])
+
+    def test_slice(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+
+        for i in range(5):
+            TestModel(name="test_{}".format(i), value=i)
+
+        queryset = TestModel.objects.order_by("value")
+        self.assertEqual([node.value for node in queryset[1:3]], [1, 2])
+        self.assertEqual(queryset[4].value, 4)
+        self.assertEqual(queryset[-1].value, 4)
+
+        with self.assertRaises(IndexError):
+            queryset[10]
+        with self.assertRaises(TypeError):
+            queryset[1:3].filter(value=1)
+
+    def test_slice_nested(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+
+        for i in range(5):
+            TestModel(name="test_{}".format(i), value=i)
+
+        queryset = TestModel.objects.order_by("value")
+        self.assertEqual([node.value for node in queryset[2:5][1:2]], [3])
+        self.assertEqual([node.value for node in queryset[2:4][0:10]], [2, 3])
+        self.assertEqual([node.value for node in queryset[1:][1:]], [2, 3, 4])
+        self.assertEqual(queryset[2:5][1].value, 3)
+
+        with self.assertRaises(IndexError):
+            queryset[2:4][2]
+
+    def test_count(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+
+        for i in range(5):
+            TestModel(name="test_{}".format(i), value=i)
+
+        self.assertEqual(TestModel.objects.count(), 5)
+        self.assertEqual(TestModel.objects.filter(value__lt=2).count(), 2)
+
+    def test_exists(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+
+        for i in range(5):
+            TestModel(name="test_{}".format(i), value=i)
+
+        self.assertTrue(TestModel.objects.filter(value=4).exists())
+        self.assertFalse(TestModel.objects.filter(value=5).exists())
+
+    def test_first(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+
+        nodes = [TestModel(name="test_{}".format(i), value=i) for i in range(5)]
+
+        self.assertEqual(TestModel.objects.order_by("-value").first(), nodes[-1])
+        self.assertIsNone(TestModel.objects.filter(value=5).first())
+
+    def test_values_list(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+
+        for i in range(5):
+            TestModel(name="test_{}".format(i), value=i)
+
+        queryset = TestModel.objects.order_by("value")
+        self.assertEqual(queryset.values_list("value", flat=True), [0, 1, 2, 3, 4])
+        self.assertEqual(queryset.values_list("name", "value")[1], ("test_1", 1))
+
+        with self.assertRaises(TypeError):
+            queryset.values_list("name", "value", flat=True)
+
+    def test_values_array(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("NumPy is not available.")
+
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+
+        for i in range(5):
+            TestModel(name="test_{}".format(i), value=i)
+
+        array = TestModel.objects.order_by("value").values_array("value")
+        self.assertEqual(array.dtype, numpy.dtype("i4"))
+        self.assertEqual(array.tolist(), [0, 1, 2, 3, 4])
+
+        array = TestModel.objects.order_by("value").values_array("name", "value")
+        self.assertEqual(array["value"].tolist(), [0, 1, 2, 3, 4])
+        self.assertEqual(array["name"][0], "test_0")
+
+    def test_operators(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+
+        nodes = [TestModel(name="test_{}".format(i), value=i) for i in range(5)]
+
+        queryset_1 = TestModel.objects.filter(value__lt=3)
+        queryset_2 = TestModel.objects.filter(value__gt=1)
+        self.assertEqual(list(queryset_1 & queryset_2), [nodes[2]])
+        self.assertEqual(len(queryset_1 | queryset_2), 5)
+        self.assertEqual(set(queryset_1 - queryset_2), set(nodes[:2]))
+        self.assertEqual(len(TestModel.objects - nodes[:4]), 1)
+        self.assertIn(nodes[0], queryset_1)
+
+    def test_operators_chain(self):
+        class TestModel(Model):
+            value = fields.IntegerField(default_value=0)
+
+        nodes = [TestModel(name="test_{}".format(i), value=i) for i in range(6)]
+
+        queryset_1 = TestModel.objects.filter(value__lt=2)
+        queryset_2 = TestModel.objects.filter(value__gt=3)
+        queryset = queryset_1 | queryset_2
+        self.assertEqual(list(queryset.filter(value__ge=1)), [nodes[1], nodes[4], nodes[5]])
+        self.assertEqual(list(queryset.order_by("-value")), [nodes[5], nodes[4], nodes[1], nodes[0]])
+        self.assertEqual(set(queryset.all()), {nodes[0], nodes[1], nodes[4], nodes[5]})
+        self.assertEqual(queryset.all().count(), 4)
+
+        queryset = TestModel.objects.filter(value__lt=4) & TestModel.objects.filter(value__gt=1)
+        self.assertEqual(list(queryset.exclude(value=2)), [nodes[3]])
+        self.assertEqual(list(queryset.order_by("-value")), [nodes[3], nodes[2]])
+        self.assertEqual(set(queryset.all()), {nodes[2], nodes[3]})
+
+        queryset = TestModel.objects.all() - nodes[:3]
+        self.assertEqual(list(queryset.filter(value__lt=5)), [nodes[3], nodes[4]])
+        self.assertEqual(list(queryset.order_by("-value")), [nodes[5], nodes[4], nodes[3]])
+        self.assertEqual(set(queryset.all()), set(nodes[3:]))
+        self.assertFalse(queryset.filter(value=0).exists())
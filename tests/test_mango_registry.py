@@ -0,0 +1,97 @@
+from maya import cmds
+from maya.api import OpenMaya
+from mayaunittest import MayaTestCase
+
+from mango.models import Model
+
+
+class TestRegistry(MayaTestCase):
+    def test_get(self):
+        node = Model(name="test")
+        handle = OpenMaya.MObjectHandle(node.object)
+        self.assertIs(Model.registry.get(handle), node)
+        self.assertIs(Model("test"), node)
+
+    def test_iter_type(self):
+        class TestModel(Model):
+            pass
+
+        node_1 = TestModel(name="test_1")
+        node_2 = TestModel(name="test_2")
+        Model(name="test_3")
+        self.assertEqual(set(m.name for m in Model.registry.iter_type("TestModel")), {"test_1", "test_2"})
+        self.assertIn(node_1, Model.registry.iter_type("TestModel"))
+        self.assertIn(node_2, Model.registry.iter_type("TestModel"))
+
+    def test_remove(self):
+        node = Model(name="test")
+        length = len(Model.registry)
+        cmds.delete("test")
+        self.assertEqual(len(Model.registry), length - 1)
+        self.assertIsNot(Model(name="test"), node)
+
+    def test_prune(self):
+        node = Model(name="test")
+        Model.registry.delete_callbacks()
+        cmds.delete("test")
+        self.assertTrue(node.exists())
+        self.assertGreaterEqual(Model.registry.prune(), 1)
+        self.assertNotIn(node, list(Model.registry.iter_type("Model")))
+
+    def test_callbacks(self):
+        class TestModel(Model):
+            pass
+
+        class TestModelCallbacks(Model):
+            node_callbacks = True
+
+        node_1 = TestModel(name="test_1")
+        node_2 = TestModelCallbacks(name="test_2")
+        self.assertEqual(len(node_1._callbacks), 0)
+        self.assertEqual(len(node_2._callbacks), 2)
+
+        cmds.delete("test_1", "test_2")
+        self.assertFalse(node_1.exists())
+        self.assertFalse(node_2.exists())
+
+    def test_memory_usage(self):
+        self.assertGreater(Model.registry.memory_usage(), 0)
+
+    def test_count_type(self):
+        class TestModel(Model):
+            pass
+
+        class TestModelInherited(TestModel):
+            pass
+
+        node = TestModel(name="test_1")
+        TestModel(name="test_2")
+        TestModelInherited(name="test_3")
+        self.assertEqual(Model.registry.count_type("TestModel"), 2)
+        self.assertEqual(TestModel.objects.count(), 2)
+        self.assertEqual(TestModel.objects_typed.count(), 3)
+        self.assertTrue(TestModelInherited.objects.exists())
+
+        node.delete()
+        self.assertEqual(Model.registry.count_type("TestModel"), 1)
+
+        cmds.file(new=True, force=True)
+        self.assertEqual(Model.registry.count_type("TestModel"), 0)
+        self.assertFalse(TestModel.objects_typed.exists())
+
+    def test_add_collision(self):
+        class TestModel(Model):
+            pass
+
+        node_1 = TestModel(name="test_1")
+        node_2 = TestModel(name="test_2")
+        Model.registry.remove(node_2)
+        node_2._hash_code = node_1.hash_code
+        Model.registry.add(node_2)
+        length = len(Model.registry)
+
+        Model.registry.add(node_1)
+        Model.registry.add(node_2)
+        self.assertEqual(len(Model.registry), length)
+        self.assertEqual(Model.registry.count_type("TestModel"), 2)
+        self.assertIs(Model.registry.get(node_2.handle), node_2)
@@ -122,3 +122,112 @@ class TestRelations(MayaTestCase):
 
         with self.assertRaises(RuntimeError):
             node_1.link_multi = node_2
+
+    def test_cache(self):
+        class TestModel(Model):
+            link = relations.OneToOneRel(rev_name="link_rev", cache=True)
+
+        node_1 = TestModel(name="test_1")
+        node_2 = TestModel(name="test_2")
+        node_3 = TestModel(name="test_3")
+
+        node_1.link = node_2
+        self.assertIs(node_1.link, node_2)
+        self.assertIs(node_1.link, node_2)
+
+        cmds.disconnectAttr("test_1.link", "test_2.link_rev")
+        self.assertIsNone(node_1.link)
+        self.assertIsNone(node_2.link_rev)
+
+        cmds.connectAttr("test_1.link", "test_3.link_rev")
+        self.assertIs(node_1.link, node_3)
+
+        node_3.delete()
+        self.assertIsNone(node_1.link)
+
+    def test_prefetch_related(self):
+        class TestModel(Model):
+            link = relations.ManyToManyRel(rev_name="link_rev")
+
+        node_1 = TestModel(name="test_1")
+        node_2 = TestModel(name="test_2")
+        node_3 = TestModel(name="test_3")
+        node_1.link.add(node_2)
+        node_2.link.add(node_3)
+
+        queryset = TestModel.objects.filter(name="test_1").prefetch_related("link__link")
+        self.assertEqual(list(queryset), [node_1])
+        self.assertEqual(list(node_1.link.all()), [node_2])
+        self.assertEqual(list(node_2.link.all()), [node_3])
+
+        node_2.link.add(node_1)
+        self.assertEqual(set(node_2.link.all()), {node_1, node_3})
+
+        queryset = TestModel.objects.order_by("name").prefetch_related("link")
+        self.assertEqual(queryset.first(), node_1)
+        self.assertEqual(queryset[1], node_2)
+        cmds.connectAttr("test_1.link[5]", "test_3.link_rev[5]")
+        self.assertEqual(set(node_1.link.all()), {node_2, node_3})
+
+        TestModel.objects.prefetch_related("link").first()
+        Model.registry.delete_callbacks()
+        cmds.disconnectAttr("test_1.link[5]", "test_3.link_rev[5]")
+        self.assertEqual(list(node_1.link.all()), [node_2])
+
+    def test_traverse(self):
+        class TestModel(Model):
+            link = relations.OneToManyRel(rev_name="link_rev")
+
+        node_1 = TestModel(name="test_1")
+        node_2 = TestModel(name="test_2")
+        node_3 = TestModel(name="test_3")
+        node_4 = TestModel(name="test_4")
+        node_1.link.add(node_2, node_3)
+        node_3.link.add(node_4)
+
+        self.assertEqual(set(node_1.traverse("link")), {node_2, node_3, node_4})
+        self.assertEqual(set(node_1.traverse("link", depth=1)), {node_2, node_3})
+        self.assertEqual(list(node_4.traverse("link", direction="reverse")), [node_3, node_1])
+        self.assertEqual(list(TestModel.objects.filter(name="test_3").traverse("link")), [node_4])
+
+        with self.assertRaises(ValueError):
+            list(node_1.traverse("link", direction="up"))
+        with self.assertRaises(ValueError):
+            list(node_1.traverse("unknown"))
+
+    def test_traverse_types(self):
+        class TestJoint(Model):
+            pass
+
+        class TestCollection(Model):
+            joint_set = relations.OneToManyRel(TestJoint, rev_name="part")
+
+        collection = TestCollection(name="collection")
+        joints = [TestJoint(name="joint_{}".format(i)) for i in range(2)]
+        collection.joint_set.add(*joints)
+
+        self.assertEqual(set(collection.traverse("joint_set")), set(joints))
+        self.assertEqual(list(joints[0].traverse("joint_set", direction="reverse")), [collection])
+
+        with self.assertRaises(ValueError):
+            list(joints[0].traverse("joint_set"))
+
+    def test_cache_collection(self):
+        class TestModel(Model):
+            link = relations.OneToManyRel(rev_name="link_rev", cache=True)
+
+        node_1 = TestModel(name="test_1")
+        node_2 = TestModel(name="test_2")
+        node_3 = TestModel(name="test_3")
+
+        node_1.link.add(node_2)
+        models = list(node_1.link.all())
+        self.assertEqual(models, [node_2])
+        models.append(node_3)
+        self.assertEqual(list(node_1.link.all()), [node_2])
+
+        cmds.connectAttr("test_1.link[5]", "test_3.link_rev")
+        self.assertEqual(set(node_1.link.all()), {node_2, node_3})
+
+        node_2.delete()
+        self.assertEqual(list(node_1.link.all()), [node_3])
@@ -0,0 +1,125 @@
+from maya import cmds
+from mayaunittest import MayaTestCase
+
+from mango import scene
+from mango import fields
+from mango.models import Model
+
+
+class TestScene(MayaTestCase):
+    def test_initialize(self):
+        class TestModel(Model):
+            value = fields.IntegerField()
+
+        TestModel(name="test_1", value=1)
+        TestModel(name="test_2", value=2)
+        Model.registry.clear()
+
+        report = scene.initialize()
+        self.assertEqual(len(list(Model.registry.iter_type("TestModel"))), 2)
+        self.assertEqual(report.counts, {"TestModel": 2})
+        self.assertIn("discovery", report.phases)
+        self.assertIn("attribute validation", report.phases)
+        self.assertEqual(report.slowest(1)[0][0], "TestModel")
+
+    def test_initialize_lazy(self):
+        class TestModel(Model):
+            value = fields.IntegerField()
+
+        TestModel(name="test_1", value=1)
+        TestModel(name="test_2", value=2)
+        Model.registry.clear()
+
+        scene.initialize(lazy=True)
+        self.assertTrue(Model.registry.has_pending())
+        self.assertEqual(len(list(Model.registry.iter_type("TestModel"))), 0)
+
+        self.assertEqual(TestModel.objects.length(), 2)
+        self.assertFalse(Model.registry.has_pending())
+        self.assertEqual(TestModel.objects.get(name="test_2").value, 2)
+
+    def test_discover(self):
+        class TestModel(Model):
+            pass
+
+        TestModel(name="test_1")
+        TestModel(name="hello:test_2")
+        Model(name="test_3")
+
+        discovery = scene.discover()
+        self.assertEqual(discovery.strategy, scene.DISCOVER_PATTERN)
+        self.assertEqual(len(discovery), 2)
+
+        discovery = scene.discover(strategy=scene.DISCOVER_ITERATOR)
+        self.assertEqual(discovery.strategy, scene.DISCOVER_ITERATOR)
+        self.assertEqual(len(discovery), 2)
+
+        with self.assertRaises(ValueError):
+            scene.discover(strategy="invalid")
+
+    def test_initialize_tracked(self):
+        class TestModel(Model):
+            pass
+
+        TestModel(name="test_1")
+        Model.registry.clear()
+
+        scene.track("import")
+        TestModel(name="test_2")
+        cmds.createNode("network", name="test_3")
+        Model.registry.clear()
+        scene.track("reference")
+        scene.initialize_tracked("reference")
+        self.assertTrue(scene.tracker.is_tracking())
+        scene.initialize_tracked("import")
+        self.assertFalse(scene.tracker.is_tracking())
+
+        names = set(model.name for model in Model.registry)
+        self.assertIn("test_2", names)
+        self.assertNotIn("test_1", names)
+        self.assertNotIn("test_3", names)
+
+    def test_migrate(self):
+        class TestModel(Model):
+            value = fields.IntegerField()
+
+        TestModel(name="test")
+        cmds.deleteAttr("test.value")
+        cmds.setAttr("test.mango_schema", "", type="string")
+        Model.registry.clear()
+
+        node = TestModel("test")
+        self.assertTrue(node.has_attribute("value"))
+        self.assertNotEqual(node.get_schema(), TestModel.schema)
+
+        report = scene.migrate()
+        self.assertEqual(node.get_schema(), TestModel.schema)
+        self.assertEqual(report.counts, {"TestModel": 1})
+
+        report = scene.migrate()
+        self.assertEqual(report.counts, {})
+
+    def test_track_nested(self):
+        class TestModel(Model):
+            pass
+
+        scene.track("reference")
+        scene.track("reference")
+        TestModel(name="test_1")
+        Model.registry.clear()
+        self.assertIsNone(scene.initialize_tracked("reference"))
+        self.assertTrue(scene.tracker.is_tracking())
+
+        TestModel(name="test_2")
+        Model.registry.clear()
+        self.assertIsNotNone(scene.initialize_tracked("reference"))
+        self.assertFalse(scene.tracker.is_tracking())
+
+        names = set(model.name for model in Model.registry)
+        self.assertEqual(names, {"test_1", "test_2"})
+
+    def test_track_unstopped(self):
+        scene.track("import")
+        scene.tracker.reset()
+        self.assertFalse(scene.tracker.is_tracking())
+        self.assertIsNone(scene.initialize_tracked("reference"))